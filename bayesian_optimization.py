@@ -1,7 +1,79 @@
+import copy
+import math
 import numpy as np
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF, WhiteKernel
-from scipy.stats import norm
+from scipy.linalg import solve_triangular
+from scipy.optimize import minimize
+from scipy.special import erf
+from scipy.stats import qmc
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba가 없으면 NumPy 경로 사용
+    _HAS_NUMBA = False
+
+# 표준정규분포 CDF/PDF 계산용 상수
+_INV_SQRT2 = 1.0 / np.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+_EI_EPS = 1e-9
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ei_kernel(Xc, Xt, L, alpha, inv_l2, prior_var,
+                   y_mean, y_std, y_max, xi):
+        """
+        RBF 커널 + GP 예측 + EI 계산을 후보 점마다 한 루프로 처리.
+        Xc: 후보 점 (M, D), Xt: 학습 점 (N, D) - 모두 [0, 1] 정규화 좌표
+        L, alpha: 학습된 GP의 Cholesky 인자와 alpha_ (정규화된 y 기준)
+        inv_l2: 차원별 1 / length_scale^2 (D,)
+        """
+        M = Xc.shape[0]
+        N = Xt.shape[0]
+        D = Xc.shape[1]
+        inv_sqrt2 = 1.0 / math.sqrt(2.0)
+        inv_sqrt_2pi = 1.0 / math.sqrt(2.0 * math.pi)
+        out = np.empty(M)
+
+        for i in prange(M):
+            # k_i = K(x_i, X_train)
+            k = np.empty(N)
+            for j in range(N):
+                sq = 0.0
+                for d in range(D):
+                    t = Xc[i, d] - Xt[j, d]
+                    sq += t * t * inv_l2[d]
+                k[j] = math.exp(-0.5 * sq)
+
+            mu = 0.0
+            for j in range(N):
+                mu += k[j] * alpha[j]
+
+            # L v = k_i 전진 대입 (k를 v로 덮어씀)
+            vv = 0.0
+            for j in range(N):
+                s = k[j]
+                for m in range(j):
+                    s -= L[j, m] * k[m]
+                k[j] = s / L[j, j]
+                vv += k[j] * k[j]
+
+            var = prior_var - vv
+            if var < 0.0:
+                var = 0.0
+
+            # normalize_y 역변환
+            mu = y_std * mu + y_mean
+            std = max(math.sqrt(var) * y_std, 1e-9)
+
+            diff = mu - y_max - xi
+            z = diff / std
+            cdf = 0.5 * (1.0 + math.erf(z * inv_sqrt2))
+            pdf = inv_sqrt_2pi * math.exp(-0.5 * z * z)
+            out[i] = max(diff * cdf + std * pdf, 0.0)
+
+        return out
 
 class BayesianOptimizer:
     """
@@ -16,20 +88,39 @@ class BayesianOptimizer:
                  p_range=(0, 180),
                  alpha=1e-3,
                  length_scale=50.0, 
-                 n_restarts_optimizer=5):
+                 n_restarts_optimizer=5,
+                 initial_capacity=64,
+                 candidate_pool_size=2048,
+                 local_seed_pool_size=256):
         """
         파라미터 범위와 GP 파라미터 설정.
         alpha: 관측 노이즈 분산 추정용(너무 작으면 overfitting)
-        length_scale: RBF 커널의 길이 스케일 초깃값
+        length_scale: RBF 커널의 길이 스케일 초깃값 (파라미터 단위, 스칼라 또는 길이 4)
+                      내부에서는 각 축 범위로 나눈 [0, 1] 정규화 좌표 기준 값으로 변환해 사용
         n_restarts_optimizer: GPR 내부 옵티마이저 재시도 횟수
+        initial_capacity: 관측 버퍼 초기 크기 (가득 차면 2배로 확장)
+        candidate_pool_size: 반복마다 재사용할 Sobol 후보 점 개수 (2의 거듭제곱 권장)
+        local_seed_pool_size: L-BFGS-B 국소 최적화를 쓸 때 시작점 선정에 쓰는 후보 수
+                              (고정 후보 풀의 앞부분, 2의 거듭제곱 권장)
         """
         self.theta_range = theta_range
         self.phi_range = phi_range
         self.h_range = h_range
         self.p_range = p_range
 
-        # GP 커널 설정 (RBF + WhiteKernel)
-        kernel = RBF(length_scale=length_scale) + WhiteKernel(noise_level=alpha)
+        # 후보 점 생성 및 입력 정규화용 하한/폭 벡터와 난수 생성기
+        self._lo = np.array([theta_range[0], phi_range[0], h_range[0], p_range[0]], dtype=float)
+        self._scale = np.array([theta_range[1] - theta_range[0],
+                                phi_range[1] - phi_range[0],
+                                h_range[1] - h_range[0],
+                                p_range[1] - p_range[0]], dtype=float)
+        self._rng = np.random.default_rng()
+
+        # GP 커널 설정 (차원별 길이 스케일을 갖는 RBF + WhiteKernel)
+        # 각 축의 범위가 크게 달라 입력을 [0, 1]로 정규화한 좌표에서 학습한다
+        length_scale = np.broadcast_to(np.asarray(length_scale, dtype=float), (4,)) / self._scale
+        kernel = (RBF(length_scale=length_scale, length_scale_bounds=(1e-2, 1e1))
+                  + WhiteKernel(noise_level=alpha))
         self.gpr = GaussianProcessRegressor(
             kernel=kernel,
             alpha=0.0,  # WhiteKernel에서 이미 노이즈를 처리
@@ -37,33 +128,179 @@ class BayesianOptimizer:
             normalize_y=True
         )
 
-        # 관측 데이터 (X: Nx4, y: Nx1)
-        self.X = None
-        self.y = None
+        # 하이퍼파라미터 warm-start 용 (초기 커널, 재시도 횟수, 직전 학습 결과)
+        self._kernel0 = kernel
+        self._n_restarts = n_restarts_optimizer
+        self._last_theta = None
+
+        # 관측 데이터 버퍼 (X: Nx4, y: Nx1), 앞쪽 _n개만 유효
+        # _U는 GP 학습에 쓰는 [0, 1] 정규화 좌표
+        capacity = max(int(initial_capacity), 1)
+        self._X = np.empty((capacity, 4), dtype=float)
+        self._U = np.empty((capacity, 4), dtype=float)
+        self._y = np.empty(capacity, dtype=float)
+        self._n = 0
+
+        # 고정 후보 풀 (Sobol 준난수) 과 후보-관측 간 차원별 제곱차 캐시 (4 x M x capacity)
+        # 제곱차는 커널 하이퍼파라미터와 무관하므로 관측이 추가될 때 열 하나만 계산
+        self._U_cand = qmc.Sobol(d=4).random(candidate_pool_size)
+        self._X_cand = self._U_cand * self._scale + self._lo
+        # 국소 최적화용 seed 풀: Sobol 수열의 앞 2^k개도 고르게 분포하므로 풀의 앞부분을 그대로 사용
+        self._X_seed = self._X_cand[:min(int(local_seed_pool_size), candidate_pool_size)]
+        self._sq_diff = np.empty((4, candidate_pool_size, capacity), dtype=float)
+
+        # NumPy 경로 EI 계산용 작업 버퍼
+        self._ei_buf = np.empty((2, candidate_pool_size), dtype=float)
+
+    @property
+    def X(self):
+        """유효한 관측 입력 (복사 없는 view), 관측이 없으면 None"""
+        if self._n == 0:
+            return None
+        return self._X[:self._n]
+
+    @property
+    def y(self):
+        """유효한 관측 결과 (복사 없는 view), 관측이 없으면 None"""
+        if self._n == 0:
+            return None
+        return self._y[:self._n]
+
+    def _grow(self):
+        """버퍼가 가득 찼을 때 용량을 2배로 늘리고 기존 데이터를 한 번만 복사"""
+        capacity = self._X.shape[0] * 2
+        new_X = np.empty((capacity, self._X.shape[1]), dtype=float)
+        new_U = np.empty((capacity, self._U.shape[1]), dtype=float)
+        new_y = np.empty(capacity, dtype=float)
+        new_sq_diff = np.empty(self._sq_diff.shape[:2] + (capacity,), dtype=float)
+        new_X[:self._n] = self._X[:self._n]
+        new_U[:self._n] = self._U[:self._n]
+        new_y[:self._n] = self._y[:self._n]
+        new_sq_diff[:, :, :self._n] = self._sq_diff[:, :, :self._n]
+        self._X = new_X
+        self._U = new_U
+        self._y = new_y
+        self._sq_diff = new_sq_diff
 
     def add_observation(self, x, y):
         """
         x: (theta, phi, h, p) 형태의 tuple or list
         y: 스칼라 (채널 파워, EIRP 등)
         """
-        x_arr = np.array(x, dtype=float).reshape(1, -1)
-        y_arr = np.array([y], dtype=float)
-        
-        if self.X is None:
-            self.X = x_arr
-            self.y = y_arr
-        else:
-            self.X = np.vstack([self.X, x_arr])
-            self.y = np.concatenate([self.y, y_arr])
+        if self._n == self._X.shape[0]:
+            self._grow()
+
+        x_arr = np.asarray(x, dtype=float).ravel()
+        u_arr = self._normalize(x_arr)
+        self._X[self._n] = x_arr
+        self._U[self._n] = u_arr
+        self._y[self._n] = float(y)
+
+        diff = self._U_cand - u_arr
+        np.square(diff.T, out=self._sq_diff[:, :, self._n])
+        self._n += 1
+
+    def _normalize(self, X):
+        """파라미터 공간 좌표를 [0, 1] 정규화 좌표로 변환"""
+        return (X - self._lo) / self._scale
 
     def train_gp(self):
         """
         현재까지 축적된 (X, y) 데이터를 이용해 GP 학습
         """
-        if self.X is None or len(self.X) < 2:
+        if self._n < 2:
             # 데이터가 너무 적을 경우 그냥 pass
             return
-        self.gpr.fit(self.X, self.y)
+
+        if self._last_theta is None:
+            self._fit_cold()
+        else:
+            # 직전 하이퍼파라미터에서 시작해 한 번만 국소 최적화 (관측이 하나 늘어도 최적점은 거의 그대로)
+            self.gpr.kernel = self._kernel0.clone_with_theta(self._last_theta)
+            self.gpr.n_restarts_optimizer = 0
+            self.gpr.fit(self._U[:self._n], self.y)
+
+            # 초기 커널 값보다도 likelihood가 나쁘면 나쁜 국소해로 보고 원래 재시도 횟수로 다시 학습
+            lml_initial = self.gpr.log_marginal_likelihood(self._kernel0.theta)
+            if self.gpr.log_marginal_likelihood_value_ < lml_initial:
+                self._fit_cold()
+
+        self._last_theta = self.gpr.kernel_.theta
+
+    def _fit_cold(self):
+        """초기 커널에서 시작해 n_restarts_optimizer번 재시도하며 학습"""
+        self.gpr.kernel = self._kernel0
+        self.gpr.n_restarts_optimizer = self._n_restarts
+        self.gpr.fit(self._U[:self._n], self.y)
+
+    def _refit_fixed_hyperparameters(self):
+        """
+        직전 학습에서 추정된 커널 하이퍼파라미터를 고정한 채로 GP를 다시 학습.
+        (Constant Liar 반복 시 매번 하이퍼파라미터를 재최적화하지 않기 위함)
+        """
+        if not hasattr(self.gpr, 'kernel_'):
+            self.train_gp()
+            return
+        kernel, optimizer = self.gpr.kernel, self.gpr.optimizer
+        self.gpr.kernel, self.gpr.optimizer = self.gpr.kernel_, None
+        try:
+            self.gpr.fit(self._U[:self._n], self.y)
+        finally:
+            self.gpr.kernel, self.gpr.optimizer = kernel, optimizer
+
+    def _predict(self, X_candidates):
+        """
+        GP 예측(평균, 표준편차).
+        고정 후보 풀에 대해서는 캐시된 차원별 제곱차로 K(X_cand, X_train)를 만들고
+        학습된 L_, alpha_를 재사용해 직접 예측한다.
+        """
+        n_pool = self._pool_rows(X_candidates)
+        if n_pool is None:
+            return self.gpr.predict(self._normalize(X_candidates), return_std=True)
+
+        gpr = self.gpr
+        kernel = gpr.kernel_
+        inv_l2 = 1.0 / np.broadcast_to(kernel.k1.length_scale, (4,)) ** 2
+        noise_level = kernel.k2.noise_level
+
+        # RBF: exp(-0.5 * sum_d (dx_d / l_d)^2), WhiteKernel은 서로 다른 점 사이에서 0
+        # (GP가 학습된 시점의 관측 개수만큼의 열만 사용)
+        n_train = gpr.X_train_.shape[0]
+        K_trans = np.einsum('d,dmn->mn', inv_l2, self._sq_diff[:, :n_pool, :n_train])
+        K_trans *= -0.5
+        np.exp(K_trans, out=K_trans)
+
+        mu = K_trans @ gpr.alpha_
+        V = solve_triangular(gpr.L_, K_trans.T, lower=True, check_finite=False)
+        var = (1.0 + noise_level) - np.einsum('ij,ij->j', V, V)
+        np.maximum(var, 0.0, out=var)
+
+        # normalize_y=True 역변환
+        mu = gpr._y_train_std * mu + gpr._y_train_mean
+        std = np.sqrt(var) * gpr._y_train_std
+        return mu, std
+
+    def _pool_rows(self, X_candidates):
+        """X_candidates가 고정 후보 풀 또는 seed 풀이면 행 수, 아니면 None"""
+        if X_candidates is self._X_cand or X_candidates is self._X_seed:
+            return len(X_candidates)
+        return None
+
+    def _candidates(self, n_candidates):
+        """n_candidates가 None이면 고정 후보 풀, 아니면 새 무작위 후보"""
+        if n_candidates is None:
+            return self._X_cand
+        return self._generate_candidates(n_candidates)
+
+    def _generate_candidates(self, n_candidates):
+        """
+        파라미터 공간에서 균일 분포로 후보 점 생성.
+        한 번의 난수 호출로 C-contiguous (n_candidates, 4) 배열을 만든다.
+        """
+        X_candidates = self._rng.random((n_candidates, 4))
+        X_candidates *= self._scale
+        X_candidates += self._lo
+        return X_candidates
 
     def expected_improvement(self, X_candidates, xi=0.01):
         """
@@ -71,43 +308,94 @@ class BayesianOptimizer:
         X_candidates: shape (M, 4)
         xi: 탐색/활발도 조절 파라미터(Exploration)
         """
-        if self.X is None or len(self.X) < 2:
+        if self._n < 2:
             # 관측값이 거의 없다면, EI 대신 무작위 탐색으로 간주
             return np.random.rand(len(X_candidates))
 
         # 현재까지의 최대 관측값
         y_max = np.max(self.y)
 
+        if _HAS_NUMBA:
+            return self._expected_improvement_jit(X_candidates, y_max, xi)
+
         # GP 예측(평균, 표준편차)
-        mu, std = self.gpr.predict(X_candidates, return_std=True)
-        
+        mu, std = self._predict(X_candidates)
+        tmp, tmp2 = self._ei_buffers(len(mu))
+
         # EI 계산
         # z = (mu - y_max - xi) / std
         # EI = (mu - y_max - xi) * Phi(z) + std * phi(z)
         # 단, std=0이면 EI=0
-        eps = 1e-9
-        std = np.maximum(std, eps)
-        z = (mu - y_max - xi) / std
-        ei = (mu - y_max - xi) * norm.cdf(z) + std * norm.pdf(z)
-        ei = np.maximum(ei, 0.0)
-        
+        # (norm.cdf/pdf 대신 erf/exp를 직접 사용하고, out= 로 임시 배열 생성을 최소화)
+        np.maximum(std, _EI_EPS, out=std)
+        diff = mu
+        diff -= y_max + xi
+        z = np.divide(diff, std, out=tmp)
+
+        # tmp2 = std * phi(z)
+        np.multiply(z, z, out=tmp2)
+        tmp2 *= -0.5
+        np.exp(tmp2, out=tmp2)
+        tmp2 *= _INV_SQRT_2PI
+        tmp2 *= std
+
+        # tmp = Phi(z)
+        z *= _INV_SQRT2
+        erf(z, out=z)
+        z += 1.0
+        z *= 0.5
+
+        ei = np.multiply(diff, z, out=diff)
+        ei += tmp2
+        np.maximum(ei, 0.0, out=ei)  # 수치 오차로 인한 음수 제거
+
         return ei
 
-    def suggest_next_point(self, n_candidates=2000, xi=0.01):
+    def _ei_buffers(self, size):
+        """EI 계산용 작업 버퍼 2개 (후보 수가 버퍼보다 클 때만 재할당)"""
+        if self._ei_buf.shape[1] < size:
+            self._ei_buf = np.empty((2, size), dtype=float)
+        return self._ei_buf[0, :size], self._ei_buf[1, :size]
+
+    def _expected_improvement_jit(self, X_candidates, y_max, xi):
+        """학습된 GP의 L_, alpha_, 커널 파라미터를 꺼내 numba 커널로 EI 계산"""
+        gpr = self.gpr
+        kernel = gpr.kernel_
+        n_pool = self._pool_rows(X_candidates)
+        if n_pool is not None:
+            U_candidates = self._U_cand[:n_pool]
+        else:
+            U_candidates = np.ascontiguousarray(self._normalize(X_candidates), dtype=float)
+        inv_l2 = 1.0 / np.broadcast_to(kernel.k1.length_scale, (4,)) ** 2
+        return _ei_kernel(
+            U_candidates,
+            gpr.X_train_,
+            gpr.L_,
+            gpr.alpha_,
+            np.ascontiguousarray(inv_l2, dtype=float),
+            1.0 + float(kernel.k2.noise_level),
+            float(gpr._y_train_mean),
+            float(gpr._y_train_std),
+            float(y_max),
+            float(xi),
+        )
+
+    def suggest_next_point(self, n_candidates=None, xi=0.01, n_local_starts=0):
         """
-        파라미터 공간에서 무작위로 n_candidates개를 뽑아서
-        EI를 계산하고, EI가 최대인 지점을 반환.
+        후보 점들에 대해 EI를 계산하고, EI가 최대인 지점을 반환.
+        n_candidates가 None이면 고정 Sobol 후보 풀을 재사용하고,
+        정수면 파라미터 공간에서 무작위로 n_candidates개를 새로 뽑는다.
+        n_local_starts: EI 상위 후보 몇 개에서 L-BFGS-B로 EI를 국소 최대화할지 (0이면 생략)
+                        0보다 크고 n_candidates가 None이면 전체 풀 대신 seed 풀(기본 256개)에서 시작점을 고른다
 
         실제 구현에선 BaysOpt 라이브러리나
         혹은 더 정교한 최적화 기법을 사용 가능.
         """
-        # 1) 랜덤 샘플 생성
-        thetas = np.random.uniform(self.theta_range[0], self.theta_range[1], n_candidates)
-        phis = np.random.uniform(self.phi_range[0], self.phi_range[1], n_candidates)
-        hs = np.random.uniform(self.h_range[0], self.h_range[1], n_candidates)
-        ps = np.random.uniform(self.p_range[0], self.p_range[1], n_candidates)
-        
-        X_candidates = np.vstack([thetas, phis, hs, ps]).T  # shape (n_candidates, 4)
+        # 1) 후보 점 준비 (국소 최적화를 하면 전체 풀 대신 작은 seed 풀로 충분)
+        if n_candidates is None and n_local_starts > 0:
+            X_candidates = self._X_seed
+        else:
+            X_candidates = self._candidates(n_candidates)
 
         # 2) GP 훈련(파라미터 재추정)
         self.train_gp()
@@ -117,7 +405,122 @@ class BayesianOptimizer:
 
         # 4) EI 최대 지점 선택
         max_idx = np.argmax(ei_values)
-        best_x = X_candidates[max_idx]
+        best_x = X_candidates[max_idx].copy()  # 고정 후보 풀의 view를 그대로 반환하지 않도록 복사
         best_ei = ei_values[max_idx]
 
+        # 5) 상위 후보에서 시작하는 L-BFGS-B 국소 최적화로 보정
+        if n_local_starts > 0 and self._n >= 2:
+            best_x, best_ei = self._maximize_ei_locally(
+                X_candidates, ei_values, best_x, best_ei, xi, n_local_starts)
+
+        return best_x, best_ei
+
+    def _maximize_ei_locally(self, X_candidates, ei_values, best_x, best_ei, xi,
+                             n_starts, maxiter=20):
+        """
+        EI 상위 n_starts개 후보에서 L-BFGS-B multi-start로 EI를 최대화.
+        최적화는 [0, 1] 정규화 좌표에서 해석적 기울기(jac)로 수행하고,
+        후보 중 최선값보다 나은 경우에만 교체한다.
+        """
+        y_max = float(np.max(self.y))
+
+        n_starts = min(n_starts, len(ei_values))
+        seeds = np.argpartition(ei_values, -n_starts)[-n_starts:]
+        bounds = [(0.0, 1.0)] * 4
+        for idx in seeds:
+            u0 = self._normalize(X_candidates[idx])
+            res = minimize(self._neg_ei_and_grad, u0, args=(y_max, xi), jac=True,
+                           method='L-BFGS-B', bounds=bounds, options={'maxiter': maxiter})
+            if -res.fun > best_ei:
+                best_ei = -res.fun
+                best_x = self._lo + np.clip(res.x, 0.0, 1.0) * self._scale
+
         return best_x, best_ei
+
+    def _neg_ei_and_grad(self, u, y_max, xi):
+        """
+        정규화 좌표 u 한 점에서 -EI와 그 기울기를 계산 (L-BFGS-B의 jac=True 용).
+        RBF 커널 기울기 dk/du = -k * (u - X_train) / l^2 로 평균/분산의 기울기를 구해
+        dEI/du = dmu/du * Phi(z) + dstd/du * phi(z) 를 만든다.
+        """
+        gpr = self.gpr
+        kernel = gpr.kernel_
+        inv_l2 = 1.0 / np.broadcast_to(kernel.k1.length_scale, (4,)) ** 2
+        y_std = float(gpr._y_train_std)
+
+        diff = u - gpr.X_train_                      # (N, 4)
+        k = np.exp(-0.5 * (diff * diff) @ inv_l2)    # (N,)
+        dk = -(k[:, None] * diff) * inv_l2           # (N, 4)
+
+        # v = L^-1 k, w = K^-1 k
+        v = solve_triangular(gpr.L_, k, lower=True, check_finite=False)
+        w = solve_triangular(gpr.L_, v, lower=True, trans='T', check_finite=False)
+
+        mu = y_std * (k @ gpr.alpha_) + gpr._y_train_mean
+        dmu = y_std * (gpr.alpha_ @ dk)
+
+        var = (1.0 + kernel.k2.noise_level) - v @ v
+        std = math.sqrt(max(var, 0.0)) * y_std
+        if std > _EI_EPS:
+            # std = y_std * sqrt(var), dvar/du = -2 w^T dk
+            dstd = -(y_std * y_std / std) * (w @ dk)
+        else:
+            std, dstd = _EI_EPS, np.zeros(4)
+
+        improvement = mu - y_max - xi
+        z = improvement / std
+        cdf = 0.5 * (1.0 + math.erf(z * _INV_SQRT2))
+        pdf = _INV_SQRT_2PI * math.exp(-0.5 * z * z)
+        ei = improvement * cdf + std * pdf
+        if ei <= 0.0:
+            return 0.0, np.zeros(4)
+        return -ei, -(dmu * cdf + dstd * pdf)
+
+    def suggest_next_batch(self, q=2, n_candidates=None, xi=0.01, strategy='CL-max'):
+        """
+        Constant Liar 휴리스틱으로 한 번에 q개의 측정 지점을 제안.
+
+        EI 최대 지점을 고른 뒤 그 지점에 가짜 관측값(lie)을 임시로 추가하고
+        GP를 다시 학습해 다음 지점을 고르는 과정을 q번 반복한다.
+        반복이 끝나면 임시 관측값과 GP 상태는 원래대로 되돌린다.
+
+        n_candidates: None이면 고정 후보 풀 재사용 (suggest_next_point와 동일)
+        strategy: 'CL-max' | 'CL-min' | 'CL-mean' (lie 값으로 쓸 관측값 통계)
+        반환값: (best_xs, best_eis) - shape (q, 4), (q,)
+        """
+        lie_funcs = {'CL-max': np.max, 'CL-min': np.min, 'CL-mean': np.mean}
+        if strategy not in lie_funcs:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        X_candidates = self._candidates(n_candidates)
+        n_candidates = len(X_candidates)
+        q = min(q, n_candidates)
+
+        self.train_gp()
+
+        n_orig = self._n
+        gpr_orig = copy.deepcopy(self.gpr)
+        lie = float(lie_funcs[strategy](self.y)) if self._n > 0 else 0.0
+
+        best_xs = np.empty((q, 4), dtype=float)
+        best_eis = np.empty(q, dtype=float)
+        chosen = np.zeros(n_candidates, dtype=bool)
+        try:
+            for k in range(q):
+                ei_values = self.expected_improvement(X_candidates, xi=xi)
+                ei_values[chosen] = -np.inf  # 이미 선택된 후보는 제외
+
+                best_idx = np.argmax(ei_values)
+                chosen[best_idx] = True
+                best_xs[k] = X_candidates[best_idx]  # 새 배열에 값 복사 (후보 풀과 메모리 공유 없음)
+                best_eis[k] = ei_values[best_idx]
+
+                if k < q - 1:
+                    self.add_observation(X_candidates[best_idx], lie)
+                    self._refit_fixed_hyperparameters()
+        finally:
+            # 임시 관측값(lie) 롤백
+            self._n = n_orig
+            self.gpr = gpr_orig
+
+        return best_xs, best_eis
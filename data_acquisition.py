@@ -1,18 +1,21 @@
 # data_acquisition.py
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from modbus_control import ModbusDevice
 from instrument_control import run_spectrum_test
 
-def measure_eirp(device_ht, device_roll, analyzer_settings, excel_file_path, target_height_mm, target_roll_deg, center_frequency):
+def measure_eirp(device_ht, device_roll, analyzer_settings, excel_file_path, target_height_mm, target_roll_deg, center_frequency, pxa=None):
     """
-    1) 포지셔너(Height, Roll)를 원하는 위치로 이동
+    1) 포지셔너(Height, Roll)를 원하는 위치로 동시에 이동
     2) 이동 완료 후 스펙트럼 분석기 측정(run_spectrum_test)
     3) EIRP(또는 Channel Power) 결과 반환
+    pxa: 재사용할 스펙트럼 분석기 세션 (None이면 측정마다 새로 연결)
     """
-    # 높이 축 이동
-    device_ht.move_to_target(target_height_mm, True)
-    # 롤 축 이동
-    device_roll.move_to_target(target_roll_deg, False)
+    # 높이 축 / 롤 축 이동 명령을 동시에 전송 (서로 다른 포트라 독립적으로 동작)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        move_ht = executor.submit(device_ht.move_to_target, target_height_mm, True)
+        move_roll = executor.submit(device_roll.move_to_target, target_roll_deg, False)
+        wait([move_ht, move_roll])
     
     # 이동 완료 대기
     while True:
@@ -20,8 +23,8 @@ def measure_eirp(device_ht, device_roll, analyzer_settings, excel_file_path, tar
         completed_roll = device_roll.check_completion(False)
         if completed_ht and completed_roll:
             break
-        time.sleep(0.5)
+        time.sleep(0.05)
 
     # 스펙트럼 분석기 측정
-    channel_power = run_spectrum_test(center_frequency, analyzer_settings, excel_file_path)
+    channel_power = run_spectrum_test(center_frequency, analyzer_settings, excel_file_path, pxa)
     return channel_power
@@ -1,12 +1,49 @@
 # instrument_control.py
+import os
 import time
 import logging
 import sys
+from functools import lru_cache
 import pyvisa
 import pandas as pd
 
 # test_utils 모듈에서 재활용할 함수 임포트
-from test_utils import read_gpib_addresses, read_save_data, open_instrument, logger
+# (VISA ResourceManager도 test_utils의 것을 공유해 프로세스에서 한 번만 생성)
+from test_utils import read_gpib_addresses, read_save_data, open_instrument, get_resource_manager, logger
+
+##############################################################################
+# 엑셀 설정 캐시: 측정마다 같은 파일을 다시 파싱하지 않도록
+# 파일 경로별로 (수정 시각, 읽은 결과)를 보관
+##############################################################################
+
+_excel_config_cache = {}
+
+def _read_excel_config_cached(reader, file_path):
+    """
+    reader(file_path) 결과를 캐싱해 반환합니다.
+    파일이 수정되면 다시 읽고, 읽기에 실패한 결과는 캐싱하지 않습니다.
+    """
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        mtime = None
+
+    # (reader, 파일) 당 항목 하나만 유지하고 수정 시각이 바뀌면 교체 (수정할 때마다 항목이 쌓이지 않도록)
+    key = (reader.__name__, file_path)
+    cached = _excel_config_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        result = reader(file_path)
+        if not result:
+            return result
+        cached = (mtime, result)
+        _excel_config_cache[key] = cached
+    return dict(cached[1])  # 호출 측 수정이 캐시에 반영되지 않도록 복사본 반환
+
+def cached_gpib_addresses(file_path):
+    return _read_excel_config_cached(read_gpib_addresses, file_path)
+
+def cached_save_data(file_path):
+    return _read_excel_config_cached(read_save_data, file_path)
 
 ##############################################################################
 # 공통 함수: 스펙트럼 분석기 동작 대기, 풀스크린 토글 등
@@ -27,6 +64,38 @@ def safe_query(device, query, default=0.0):
         logger.warning(f"Invalid response received for query '{query}'. Defaulting to {default}")
         return default
 
+def sweep_timeout_ms(sweep_time, sweep_counts, default_timeout):
+    """
+    *OPC? 블로킹 대기에 사용할 VISA 타임아웃(ms)을 계산합니다.
+    스윕 타임이 AUTO라 추정할 수 없으면 기존 타임아웃을 그대로 사용합니다.
+    """
+    try:
+        estimate = int((float(sweep_time) * sweep_counts + 2) * 1000)
+    except (TypeError, ValueError):
+        return default_timeout
+    return max(estimate, default_timeout)
+
+def sweep_and_wait(device, sweep_time, sweep_counts):
+    """
+    단일 스윕을 시작하고 *OPC? 응답이 올 때까지 블로킹합니다.
+    대기 동안만 VISA 타임아웃을 예상 스윕 시간에 맞춰 늘립니다.
+    """
+    default_timeout = device.timeout
+    device.timeout = sweep_timeout_ms(sweep_time, sweep_counts, default_timeout)
+    try:
+        device.query(':INIT:IMM;*OPC?')
+    finally:
+        device.timeout = default_timeout
+
+def write_commands(device, commands):
+    """
+    여러 SCPI 명령을 ';'로 묶어 한 번의 write로 전송합니다.
+    (명령마다 VISA 왕복이 발생하지 않도록 compound message 사용)
+    각 명령은 ':' 또는 '*'로 시작하는 절대 경로여야 합니다.
+    """
+    if commands:
+        device.write(';'.join(commands))
+
 def toggle_full_screen(device):
     """
     스펙트럼 분석기의 현재 디스플레이 모드를 확인하고,
@@ -48,29 +117,107 @@ def initialize_analyzer(device, analyzer_settings):
     분석기(Analyzer)를 초기화하고,
     주어진 Analyzer Settings에 맞춰 기본 설정을 적용합니다.
     """
-    device.write('*RST')
-    device.write('*CLS')
-    device.write(':SYST:DISP:UPD ON')
-    device.write(':INIT:CONT OFF')
+    cmds = ['*RST', '*CLS', ':SYST:DISP:UPD ON', ':INIT:CONT OFF']
     # 트랜스듀서 보정
     transducer = analyzer_settings.get('Transducer')
     if transducer:
-        device.write(f":SENS:CORR:TRAN:SEL '{transducer}'")
-        device.write(f":SENS:CORR:TRAN:STAT ON")
+        cmds.append(f":SENS:CORR:TRAN:SEL '{transducer}'")
+        cmds.append(":SENS:CORR:TRAN:STAT ON")
     # 오프셋 레벨
     offset_level = analyzer_settings.get('Offset Level', 0)
-    device.write(f":DISP:WIND:TRAC:Y:SCAL:RLEV:OFFS {offset_level}")
+    cmds.append(f":DISP:WIND:TRAC:Y:SCAL:RLEV:OFFS {offset_level}")
+    write_commands(device, cmds)
 
 ##############################################################################
 # 메인 측정 함수 (avgEIRP.py 내용을 통합)
 ##############################################################################
 
-def run_spectrum_test(center_frequency, analyzer_settings, file_path):
+@lru_cache(maxsize=8)
+def _build_setup_commands(settings_key):
+    """
+    analyzer_settings로부터 측정마다 동일한 SCPI 설정 명령을 만듭니다.
+    반환값: (감쇠/레퍼런스 레벨 명령, 스팬 명령, 프리앰프~스윕 설정 명령)
+    """
+    analyzer_settings = dict(settings_key)
+
+    # 5) 감쇠(Attenuation)
+    level_cmds = []
+    attenuation_value = analyzer_settings.get('Attenuation', 'AUTO')
+    if attenuation_value == 'AUTO':
+        level_cmds.append(':INP:ATT:AUTO ON')
+    else:
+        level_cmds.append(':INP:ATT:AUTO OFF')
+        level_cmds.append(f':INP:ATT {attenuation_value}')
+
+    # 6) 레퍼런스 레벨 설정
+    ref_level_setting = analyzer_settings.get('Reference Level', 'AUTO')
+    if isinstance(ref_level_setting, str) and ref_level_setting.upper() == 'AUTO':
+        level_cmds.append(':DISP:WIND:TRAC:Y:SCAL:RLEV 40')  # 임시로 40 dBm 설정
+    else:
+        level_cmds.append(f':DISP:WIND:TRAC:Y:SCAL:RLEV {ref_level_setting}')
+
+    # 7) 스팬 설정 (센터 주파수는 측정마다 다름)
+    span_cmd = f':SENS:FREQ:SPAN {analyzer_settings.get("Span", 100e6)}'
+
+    # 8) 프리앰프 설정
+    cmds = []
+    if analyzer_settings.get('Preamp') == 'ON':
+        cmds.append(':INP:GAIN:STAT ON')
+        cmds.append(':INP:GAIN:VAL ON')
+
+    # 9) RBW / VBW
+    cmds.append(f':SENS:BAND:RES {analyzer_settings.get("RBW", 1e6)}')
+    cmds.append(f':SENS:BAND:VID {analyzer_settings.get("VBW", 3e6)}')
+
+    # 10) 트레이스 / 디텍터
+    cmds.append(f':DISP:WIND:SUBW:TRAC1:MODE {analyzer_settings.get("Trace Mode", "WRIT")}')
+    cmds.append(f':SENS:WIND:DET1:FUNC {analyzer_settings.get("Average Type", "POIN")}')
+    cmds.append(f':SENS:AVER:TYPE {analyzer_settings.get("Det Type", "MAXH")}')
+    cmds.append(f':SENS:POW:ACH:BWID:CHAN1 {analyzer_settings.get("Channel Bandwidth", 20e6)}')
+
+    # 11) 스윕 타임
+    sweep_time = analyzer_settings.get('Sweep Time', 'AUTO')
+    if sweep_time == 'AUTO':
+        cmds.append(':SENS:SWE:TIME:AUTO ON')
+    else:
+        cmds.append(':SENS:SWE:TIME:AUTO OFF')
+        cmds.append(f':SENS:SWE:TIME {sweep_time}')
+
+    # 스윕 포인트
+    cmds.append(f':SENS:SWE:WIND:POIN {analyzer_settings.get("Sweep Points", 1001)}')
+
+    return tuple(level_cmds), span_cmd, tuple(cmds)
+
+def get_setup_commands(analyzer_settings):
+    """
+    _build_setup_commands 결과를 analyzer_settings 내용 기준으로 캐싱해 반환합니다.
+    설정 값에 hash 불가능한 값이 있으면 캐시 없이 매번 생성합니다.
+    """
+    settings_key = tuple(sorted(analyzer_settings.items()))
+    try:
+        return _build_setup_commands(settings_key)
+    except TypeError:
+        return _build_setup_commands.__wrapped__(settings_key)
+
+def open_analyzer(file_path):
+    """
+    'Chamber Config' 시트의 Analyzer GPIB 주소로 스펙트럼 분석기 세션을 엽니다.
+    연결에 실패하면 None을 반환합니다.
+    """
+    gpib_addresses = cached_gpib_addresses(file_path)
+    analyzer_gpib_addr = gpib_addresses.get('Analyzer GPIB', '18')  # 기본값 18
+    pxa_address = f"TCPIP0::{analyzer_gpib_addr}::inst0::INSTR"
+
+    return open_instrument(pxa_address, get_resource_manager())
+
+def run_spectrum_test(center_frequency, analyzer_settings, file_path, pxa=None):
     """
     avgEIRP.py의 run_test() 내용을 참고하여 만든 스펙트럼 분석기 측정 함수입니다.
     - center_frequency: 측정할 주파수(Hz 단위)
     - analyzer_settings: 딕셔너리 형태로 필요한 스펙트럼 분석기 파라미터
     - file_path: 엑셀(Chamber Config, Save Data) 등이 위치한 파일 경로
+    - pxa: 이미 열려 있고 initialize_analyzer로 초기화된 분석기 세션.
+           None이면 이 함수 안에서 열고 초기화한 뒤 측정 후 닫습니다.
 
     반환값: channel_power (단위: dBm)
     """
@@ -78,17 +225,14 @@ def run_spectrum_test(center_frequency, analyzer_settings, file_path):
                         format='%(asctime)s - %(levelname)s - %(message)s',
                         stream=sys.stdout)
 
-    # 1) GPIB 주소 및 User ID 가져오기
-    gpib_addresses = read_gpib_addresses(file_path)
-    analyzer_gpib_addr = gpib_addresses.get('Analyzer GPIB', '18')  # 기본값 18
-    pxa_address = f"TCPIP0::{analyzer_gpib_addr}::inst0::INSTR"
-
-    save_data = read_save_data(file_path)
+    # 1) User ID 가져오기
+    save_data = cached_save_data(file_path)
     user_id = save_data.get('User ID', 'Unknown')
 
-    # 2) 스펙트럼 분석기 연결
-    rm = pyvisa.ResourceManager()
-    pxa = open_instrument(pxa_address, rm)
+    # 2) 스펙트럼 분석기 연결 (세션이 주어지지 않은 경우에만)
+    owns_session = pxa is None
+    if owns_session:
+        pxa = open_analyzer(file_path)
     
     if not pxa:
         logging.error("Failed to establish connection with the spectrum analyzer.")
@@ -97,73 +241,40 @@ def run_spectrum_test(center_frequency, analyzer_settings, file_path):
     channel_power = None
 
     try:
-        # 3) Analyzer 초기화
-        initialize_analyzer(pxa, analyzer_settings)
+        # 3) Analyzer 초기화 (*RST 포함, 세션을 새로 연 경우에만)
+        if owns_session:
+            initialize_analyzer(pxa, analyzer_settings)
 
         # 4) 사용자명(세션명) 설정
-        pxa.write(f":INST:REN 'Spectrum','{user_id}'")
+        cmds = [f":INST:REN 'Spectrum','{user_id}'"]
 
         # Occupied Bandwidth 설정 (ACP 모드 활용)
-        pxa.write(':CALC:MARK:FUNC:POW:SEL ACP')
-        pxa.write(':SENS:POW:ACH:ACP 0')
+        cmds.append(':CALC:MARK:FUNC:POW:SEL ACP')
+        cmds.append(':SENS:POW:ACH:ACP 0')
 
-        # 5) 감쇠(Attenuation)
+        # 5) 감쇠(Attenuation), 6) 레퍼런스 레벨 설정
+        level_cmds, span_cmd, sweep_setup_cmds = get_setup_commands(analyzer_settings)
         ref_level_setting = analyzer_settings.get('Reference Level', 'AUTO')
-        attenuation_value = analyzer_settings.get('Attenuation', 'AUTO')
-        if attenuation_value == 'AUTO':
-            attenuation_cmd = ':INP:ATT:AUTO ON'
+        if analyzer_settings.get('Attenuation', 'AUTO') == 'AUTO':
             print('ATT AUTO')
-        else:
-            pxa.write(':INP:ATT:AUTO OFF')
-            attenuation_cmd = f':INP:ATT {attenuation_value}'
-        pxa.write(attenuation_cmd)
-
-        # 6) 레퍼런스 레벨 설정
-        if isinstance(ref_level_setting, str) and ref_level_setting.upper() == 'AUTO':
-            pxa.write(':DISP:WIND:TRAC:Y:SCAL:RLEV 40')  # 임시로 40 dBm 설정
-        else:
-            pxa.write(f':DISP:WIND:TRAC:Y:SCAL:RLEV {ref_level_setting}')
+        cmds.extend(level_cmds)
 
         # 7) 주파수 및 스팬 설정
-        pxa.write(f':SENS:FREQ:CENT {center_frequency}')
-        pxa.write(f':SENS:FREQ:SPAN {analyzer_settings.get("Span", 100e6)}')
+        cmds.append(f':SENS:FREQ:CENT {center_frequency}')
+        cmds.append(span_cmd)
+        write_commands(pxa, cmds)
         wait_for_operation_complete(pxa)
 
-        # 8) 프리앰프 설정
-        if analyzer_settings.get('Preamp') == 'ON':
-            pxa.write(':INP:GAIN:STAT ON')
-            pxa.write(':INP:GAIN:VAL ON')
-
-        # 9) RBW / VBW
-        pxa.write(f':SENS:BAND:RES {analyzer_settings.get("RBW", 1e6)}')
-        pxa.write(f':SENS:BAND:VID {analyzer_settings.get("VBW", 3e6)}')
-
-        # 10) 트레이스 / 디텍터
-        pxa.write(f':DISP:WIND:SUBW:TRAC1:MODE {analyzer_settings.get("Trace Mode", "WRIT")}')
-        pxa.write(f':SENS:WIND:DET1:FUNC {analyzer_settings.get("Average Type", "POIN")}')
-        pxa.write(f':SENS:AVER:TYPE {analyzer_settings.get("Det Type", "MAXH")}')
-        pxa.write(f':SENS:POW:ACH:BWID:CHAN1 {analyzer_settings.get("Channel Bandwidth", 20e6)}')
-        pxa.write(attenuation_cmd)  # 재설정 (혹시 중간에 재작성 필요)
-
-        # 11) 스윕 타임
+        # 8) ~ 11) 프리앰프, RBW/VBW, 트레이스/디텍터, 스윕 설정
+        write_commands(pxa, sweep_setup_cmds)
         sweep_time = analyzer_settings.get('Sweep Time', 'AUTO')
-        if sweep_time == 'AUTO':
-            pxa.write(':SENS:SWE:TIME:AUTO ON')
-        else:
-            pxa.write(':SENS:SWE:TIME:AUTO OFF')
-            pxa.write(f':SENS:SWE:TIME {sweep_time}')
-
-        # 스윕 포인트, 횟수
-        pxa.write(f':SENS:SWE:WIND:POIN {analyzer_settings.get("Sweep Points", 1001)}')
         sweep_counts = analyzer_settings.get("Sweep Counts", 5)
 
         # 12) REF Level이 AUTO라면, 먼저 Rough Sweep으로 Peak 체크
         if isinstance(ref_level_setting, str) and ref_level_setting.upper() == 'AUTO':
-            pxa.write(f':SENS:SWE:COUN 10')
-            pxa.write(':INIT:IMM;*WAI')
-            pxa.write('CALC:MARK1:MAX:PEAK')
-            pxa.write('CALC:MARK1:STAT ON')
-            wait_for_operation_complete(pxa)
+            pxa.write(':SENS:SWE:COUN 10')
+            sweep_and_wait(pxa, sweep_time, 10)
+            write_commands(pxa, [':CALC:MARK1:MAX:PEAK', ':CALC:MARK1:STAT ON'])
 
             peak_level = safe_query(pxa, 'CALC:MARK1:Y?', default=0.0)
             print(f"Initial Peak Level: {peak_level}")
@@ -183,35 +294,28 @@ def run_spectrum_test(center_frequency, analyzer_settings, file_path):
         pxa.write(f':DISP:WIND:TRAC:Y:SCAL:RLEV {ref_level}')
         pxa.write(f':SENS:SWE:COUN {sweep_counts}')
 
-        # 13) 최종 스윕 실행
-        pxa.write(':INIT:IMM;*WAI')
-        pxa.write('CALC:MARK:AOFF')
-        wait_for_operation_complete(pxa)
+        # 13) 최종 스윕 실행 (*OPC? 응답이 올 때까지 블로킹)
+        sweep_and_wait(pxa, sweep_time, sweep_counts)
+        pxa.write(':CALC:MARK:AOFF')
 
         # 14) 채널 파워 읽기
-        while True:
-            channel_power_str = pxa.query('CALC:MARK:FUNC:POW:RES? CPOW').strip()
-            if channel_power_str:
-                try:
-                    channel_power = round(float(channel_power_str), 4)
-                    break
-                except ValueError:
-                    print(f"Invalid channel power value: {channel_power_str}")
-            else:
-                time.sleep(0.1)
+        channel_power_str = pxa.query(':CALC:MARK:FUNC:POW:RES? CPOW').strip()
+        try:
+            channel_power = round(float(channel_power_str), 4)
+        except ValueError:
+            print(f"Invalid channel power value: {channel_power_str}")
 
         # 필요하다면 추가 대기
-        wait_for_operation_complete(pxa)
         wait_time = analyzer_settings.get("Wait Time", 1)
         time.sleep(wait_time)
-        wait_for_operation_complete(pxa)
 
         print(f"Channel power: {channel_power} dBm")
 
     except pyvisa.VisaIOError as e:
         print(f"An error occurred during communication with the spectrum analyzer: {e}")
     finally:
-        pxa.close()
-        print("Connection to the spectrum analyzer has been closed.")
+        if owns_session:
+            pxa.close()
+            print("Connection to the spectrum analyzer has been closed.")
 
     return channel_power
\ No newline at end of file
@@ -1,28 +1,27 @@
 #log_handler.py
 import logging
+from collections import deque
 from threading import Lock
 
 class InMemoryLogHandler(logging.Handler):
-    def __init__(self):
+    def __init__(self, capacity=10000):
         super().__init__()
-        self._logs = []
-        self._lock = Lock()  # 스레드 안전성을 위한 락 추가
+        # 최근 capacity개만 보관하는 링 버퍼 (deque.append는 GIL 하에서 원자적)
+        self._logs = deque(maxlen=capacity)
+        self._lock = Lock()  # clear 시 부분 읽기 방지용
         
     def emit(self, record):
         try:
-            msg = self.format(record)
-            with self._lock:  # 스레드 안전한 로그 추가
-                self._logs.append(msg)
+            self._logs.append(self.format(record))  # 락 없이 추가
         except Exception:
             self.handleError(record)
             
     def get_logs(self):
-        with self._lock:
-            return self._logs.copy()  # 안전한 복사본 반환
+        return list(self._logs)  # 스냅샷 복사본 반환
         
     def clear(self):
         with self._lock:
-            self._logs = []
+            self._logs.clear()
             
     def __len__(self):
         return len(self._logs)
\ No newline at end of file
@@ -1,15 +1,19 @@
 from log_handler import InMemoryLogHandler
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 # 전역 로거 인스턴스
 _logger = None
 _log_handler = None
 _file_handler = None
+_queue_listener = None
 
 def setup_logger():
-    global _logger, _log_handler, _file_handler
+    global _logger, _log_handler, _file_handler, _queue_listener
     if _logger is None:
         _logger = logging.getLogger('test_automation')
         
@@ -33,9 +37,13 @@ def setup_logger():
             # 로그 레벨 설정
             _logger.setLevel(logging.INFO)
             
-            # 핸들러 추가
-            _logger.addHandler(_log_handler)
-            _logger.addHandler(_file_handler)
+            # 핸들러 추가: 로거에는 QueueHandler만 달고, 포맷팅과 파일 쓰기는
+            # 백그라운드 QueueListener 스레드에서 메모리/파일 핸들러로 전달
+            log_queue = queue.Queue(-1)
+            _logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _queue_listener = logging.handlers.QueueListener(log_queue, _log_handler, _file_handler)
+            _queue_listener.start()
+            atexit.register(_queue_listener.stop)  # 종료 시 남은 레코드 처리
             
             # 루트 로거로의 전파 방지
             _logger.propagate = False
@@ -3,6 +3,7 @@ import logging
 import sys
 from modbus_control import ModbusDevice
 from data_acquisition import measure_eirp
+from instrument_control import open_analyzer, initialize_analyzer
 from bayesian_optimization import SimpleBayesianOptimizer
 
 def main():
@@ -62,29 +63,39 @@ def main():
     excel_file_path = r"C:\Path\To\Your\ExcelFile.xlsx"
     center_frequency = 28e9  # 28 GHz
 
-    # (4) 초기 샘플링
-    init_samples = 3
-    for _ in range(init_samples):
-        # 예시: 초기 위치를 고정값으로 사용
-        init_height = 170
-        init_roll = 0
-        init_theta = 0
-        power = measure_eirp(device_ht, device_roll,
-                             analyzer_settings, excel_file_path,
-                             init_height, init_roll, center_frequency)
-        optimizer.add_observation((init_theta, init_roll, init_height), power)
-        logging.info(f"[INIT] Power = {power} dBm")
+    # 스펙트럼 분석기 세션은 한 번만 열고 초기화(*RST 등)한 뒤 측정마다 재사용
+    pxa = open_analyzer(excel_file_path)
+    if not pxa:
+        logging.error("Failed to establish connection with the spectrum analyzer.")
+        return
+    initialize_analyzer(pxa, analyzer_settings)
 
-    # (5) 최적화 루프
-    max_iterations = 5
-    for i in range(max_iterations):
-        next_theta, next_roll, next_height = optimizer.suggest_next_point()
-        # 여기서는 theta를 따로 안 쓰고, roll/height만 적용하는 예시
-        power = measure_eirp(device_ht, device_roll,
-                             analyzer_settings, excel_file_path,
-                             next_height, next_roll, center_frequency)
-        optimizer.add_observation((next_theta, next_roll, next_height), power)
-        logging.info(f"[ITER {i}] H={next_height}mm, R={next_roll}deg, Power={power} dBm")
+    try:
+        # (4) 초기 샘플링
+        init_samples = 3
+        for _ in range(init_samples):
+            # 예시: 초기 위치를 고정값으로 사용
+            init_height = 170
+            init_roll = 0
+            init_theta = 0
+            power = measure_eirp(device_ht, device_roll,
+                                 analyzer_settings, excel_file_path,
+                                 init_height, init_roll, center_frequency, pxa)
+            optimizer.add_observation((init_theta, init_roll, init_height), power)
+            logging.info(f"[INIT] Power = {power} dBm")
+
+        # (5) 최적화 루프
+        max_iterations = 5
+        for i in range(max_iterations):
+            next_theta, next_roll, next_height = optimizer.suggest_next_point()
+            # 여기서는 theta를 따로 안 쓰고, roll/height만 적용하는 예시
+            power = measure_eirp(device_ht, device_roll,
+                                 analyzer_settings, excel_file_path,
+                                 next_height, next_roll, center_frequency, pxa)
+            optimizer.add_observation((next_theta, next_roll, next_height), power)
+            logging.info(f"[ITER {i}] H={next_height}mm, R={next_roll}deg, Power={power} dBm")
+    finally:
+        pxa.close()
 
     logging.info("Optimization finished.")
 
@@ -284,14 +284,14 @@ class PositionerController:
         return self._execute_modbus_command(execute)
 
     def convert_to_counts(self, value: float) -> int:
-        if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
+        if self.positioner_type is PositionerType.ANTENNA_HEIGHT:
             return int(value * self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM'])
         else:
             return int(value * self.constants.STEPS_PER_DEGREE[self.positioner_type.value])
 
     def convert_from_counts(self, counts: int) -> float:
         try:
-            if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
+            if self.positioner_type is PositionerType.ANTENNA_HEIGHT:
                 return counts / self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM']  # 8960 counts/mm
             else:
                 # Roll 타입에 따른 변환
@@ -306,7 +306,7 @@ class PositionerController:
             raw_counts = self.read_raw_location()
             if raw_counts is not None:
          
-                if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
+                if self.positioner_type is PositionerType.ANTENNA_HEIGHT:
                     # 높이 변환 (8960 counts/mm)
                     mm_value = raw_counts / self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM']
                     if not (self.position_limits['MIN'] <= mm_value <= self.position_limits['MAX']):
@@ -328,7 +328,7 @@ class PositionerController:
     def read_speed(self) -> Optional[int]:
         """현재 속도를 읽는 함수"""
         def execute(instrument):
-            if self.positioner_type == PositionerType.EUT_ROLL:
+            if self.positioner_type is PositionerType.EUT_ROLL:
                 return None  # EUT Roll은 속도 설정 불가
                     
             reg_info = self.reg_map['SPEED']
@@ -344,7 +344,7 @@ class PositionerController:
         return self._execute_modbus_command(execute)
 
     def determine_shortest_path(self, current_pos: float, target_pos: float) -> float:
-        if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
+        if self.positioner_type is PositionerType.ANTENNA_HEIGHT:
             return target_pos
             
         diff = target_pos - current_pos
@@ -383,7 +383,7 @@ class PositionerController:
 
     def set_speed(self, speed: int) -> bool:
         def execute(instrument):
-            if self.positioner_type == PositionerType.EUT_ROLL:
+            if self.positioner_type is PositionerType.EUT_ROLL:
                 logging.error("EUT Roll은 속도 설정이 불가능합니다")
                 return False
                 
@@ -418,7 +418,7 @@ class PositionerController:
 
     def check_limits(self) -> bool:
         def execute(instrument):
-            if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
+            if self.positioner_type is PositionerType.ANTENNA_HEIGHT:
                 upper = instrument.read_bit(self.reg_map['UPPER_LIMIT_BIT'], 2)
                 lower = instrument.read_bit(self.reg_map['LOWER_LIMIT_BIT'], 2)
                 return not (upper or lower)
@@ -429,14 +429,14 @@ class PositionerController:
         return self._execute_modbus_command(execute)
 
     def move_up(self) -> bool:
-        if self.positioner_type != PositionerType.ANTENNA_HEIGHT:
+        if self.positioner_type is not PositionerType.ANTENNA_HEIGHT:
             return False
         def execute(instrument):
             return instrument.write_bit(self.reg_map['UP_BIT'], 1, 5)
         return self._execute_modbus_command(execute)
 
     def move_down(self) -> bool:
-        if self.positioner_type != PositionerType.ANTENNA_HEIGHT:
+        if self.positioner_type is not PositionerType.ANTENNA_HEIGHT:
             return False
         def execute(instrument):
             return instrument.write_bit(self.reg_map['DOWN_BIT'], 1, 5)
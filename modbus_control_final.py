@@ -1,17 +1,148 @@
 #modbus_control.py
 import minimalmodbus
 import serial
+import os
+import struct
+import sys
 import time
 import logging
+from abc import ABC, abstractmethod
 from enum import Enum
 import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Optional, Union, Callable
-from contextlib import nullcontext
-from typing import Dict, Optional, Union, Callable, Any
+from typing import Dict, Optional, Union, Callable, Any, Tuple
 
 # Constants
 TOLERANCE = 0.1  # 위치 허용 오차
 DEFAULT_SLAVE_ADDRESS = 233
+COMMAND_TIMEOUT = 1.0  # Modbus 명령 실행 시 시리얼 타임아웃 (초)
+MAX_POLL_INTERVAL = 0.5  # 이동 완료 대기 시 최대 폴링 간격 (초)
+SETTLE_TIME = 0.1  # 축 이동 완료 후 기계적 안정화 대기 (초)
+RESTART_IDLE_S = 0.5  # 위치 변화가 이 시간 이상 없을 때만 START 재전송 (폴링 간격과 무관)
+DEFAULT_BAUDRATE = 19200  # 컨트롤러 기본 보레이트 (다른 값으로 응답이 없을 때 되돌아갈 값)
+
+# 시리얼 통신 설정 (apply_settings로 한 번에 적용)
+SERIAL_SETTINGS = {
+    'baudrate': DEFAULT_BAUDRATE,
+    'bytesize': 8,
+    'parity': serial.PARITY_NONE,
+    'stopbits': 1,
+    'timeout': COMMAND_TIMEOUT,  # 포트 설정 시 한 번만 적용 (명령마다 재설정하지 않음)
+}
+SERIAL_BUFFER_SIZE = 65536  # Windows 드라이버 송수신 버퍼 크기 (bytes)
+# 32비트 위치 값의 워드 순서: 하위 워드 먼저 (minimalmodbus.BYTEORDER_LITTLE_SWAP = 3)
+LONG_BYTEORDER = minimalmodbus.BYTEORDER_LITTLE_SWAP
+USB_LATENCY_TIMER_MS = 1  # FTDI 계열 USB-시리얼 지연 타이머 (기본 16ms)
+
+
+def _prepare_port(instrument: minimalmodbus.Instrument) -> None:
+    """포트를 연 직후 한 번만 버퍼를 확장하고 남은 데이터를 비움
+    
+    시작 시점에 한 번 비워 두므로 매 트랜잭션 전 입력 버퍼 초기화는 끄고,
+    실패한 시도 후의 재시도에서만 버퍼를 비운다 (_execute_modbus_command 참고).
+    """
+    port = instrument.serial
+    if sys.platform == 'win32':
+        port.set_buffer_size(rx_size=SERIAL_BUFFER_SIZE, tx_size=SERIAL_BUFFER_SIZE)
+    port.reset_input_buffer()
+    port.reset_output_buffer()
+    # 드라이버에 이미 도착해 있던 잔여 바이트 제거
+    if port.in_waiting:
+        port.read(port.in_waiting)
+    instrument.clear_buffers_before_each_transaction = False
+
+
+def _set_low_latency(serial_port: serial.Serial) -> bool:
+    """USB-시리얼(FTDI) 지연 타이머를 USB_LATENCY_TIMER_MS로 낮춤
+    
+    Linux는 sysfs의 latency_timer에 직접 쓰고, 지원하지 않는 드라이버나 권한이 없으면 건너뛴다.
+    Windows는 드라이버 설정(포트 속성 > 고급 > Latency Timer)에서만 변경 가능하므로 건너뛴다.
+    """
+    if not sys.platform.startswith('linux') or not serial_port.port:
+        return False
+    tty = os.path.basename(os.path.realpath(serial_port.port))
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", 'w') as f:
+            f.write(str(USB_LATENCY_TIMER_MS))
+        return True
+    except OSError as e:
+        logging.debug("%s 지연 타이머 설정 건너뜀: %s", serial_port.port, e)
+        return False
+
+
+def _select_baudrate(instrument: minimalmodbus.Instrument, baudrate: int) -> int:
+    """요청한 보레이트로 슬레이브가 응답하지 않으면 DEFAULT_BAUDRATE로 되돌림"""
+    if baudrate == DEFAULT_BAUDRATE:
+        return baudrate
+    try:
+        instrument.read_register(0)
+        return baudrate
+    except minimalmodbus.SlaveReportedException:
+        return baudrate  # 예외 응답이라도 슬레이브가 응답했으면 해당 보레이트로 통신 가능
+    except (minimalmodbus.NoResponseError, minimalmodbus.InvalidResponseError):
+        logging.warning(f"보레이트 {baudrate} 응답 없음, {DEFAULT_BAUDRATE}로 전환")
+        instrument.serial.baudrate = DEFAULT_BAUDRATE
+        instrument.serial.reset_input_buffer()
+        return DEFAULT_BAUDRATE
+
+
+def _open_instrument(port: str, slave_address: int, baudrate: int = DEFAULT_BAUDRATE,
+                     extra_settings: Optional[dict] = None) -> minimalmodbus.Instrument:
+    """Instrument 생성 후 통신 파라미터 적용, 지연 타이머 설정, 버퍼 정리, 보레이트 확인"""
+    instrument = minimalmodbus.Instrument(port, slave_address)
+    instrument.serial.apply_settings({**SERIAL_SETTINGS, 'baudrate': baudrate, **(extra_settings or {})})
+    _set_low_latency(instrument.serial)
+    _prepare_port(instrument)
+    _select_baudrate(instrument, baudrate)
+    return instrument
+
+
+def _make_crc16_table() -> tuple:
+    """Modbus CRC16 (다항식 0xA001) 바이트 단위 룩업 테이블 생성"""
+    table = []
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _make_crc16_table()
+
+
+def _crc16_modbus(data: bytes) -> int:
+    """Modbus RTU CRC16 계산 (테이블 방식: 바이트당 1회 조회)"""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+class _LogRateLimiter:
+    """호출 위치(key)별로 interval초에 한 번만 로그를 허용 (버스 장애 시 폴링 루프의 로그 폭주 방지)"""
+    
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._last = {}
+
+    def allow(self, key) -> bool:
+        now = time.monotonic()
+        if now - self._last.get(key, float('-inf')) < self.interval:
+            return False
+        self._last[key] = now
+        return True
+
+
+_log_limiter = _LogRateLimiter()
+
+
+def _build_read_request(slave_address: int, functioncode: int, address: int, count: int) -> bytes:
+    """고정된 읽기 요청 RTU 프레임 생성 (주소, FC, 시작 주소, 개수, CRC)"""
+    payload = struct.pack('>BBHH', slave_address, functioncode, address, count)
+    return payload + struct.pack('<H', _crc16_modbus(payload))
 
 class PositionerType(Enum):
     ANTENNA_ROLL = "ANT_ROLL"
@@ -68,6 +199,14 @@ class PositionerConstants:
         }
     }
 
+    # START 펄스 폭 (초): START 0 -> 1 엣지 사이 간격, 컨트롤러 스캔 주기 이상이면 충분
+    START_PULSE_S = {
+        'TT_ROLL': 0.02,
+        'EUT_ROLL': 0.02,
+        'ANT_ROLL': 0.02,
+        'ANT_HEIGHT': 0.02
+    }
+
     # 높이 관련 상수
     HEIGHT_CONSTANTS = {
         'COUNTS_PER_REV': 800,       # 800 motor counts/rev
@@ -81,6 +220,7 @@ class PositionerConstants:
         'ANT_HEIGHT': {
             'LOCATION': {'start': 0, 'length': 3},  # 1-2번 주소 (-1 보정)
             'TARGET': {'start': 2, 'length': 3},    # 3-4번 주소 (-1 보정)
+            'START_REGISTER': None,   # TARGET 직후의 START 레지스터 (FC16 병합용, 코일만 지원 시 None)
             'SPEED': {'start': 8, 'length': 1},     # 9-10번 주소 (-1 보정)
             'START_BIT': 0,           # Modbus Address 1
             'ENABLE_BIT': 1,          # OutBitD3
@@ -89,48 +229,45 @@ class PositionerConstants:
             'DOWN_BIT': 4,           # down_ht
             'UPPER_LIMIT_BIT': 11,    # InBitC5
             'LOWER_LIMIT_BIT': 12,    # InBitC6
-            'STOP_BIT': 14           # stop_ht
+            'LIMIT_BITS': {'start': 11, 'count': 2},  # UPPER/LOWER 연속 주소 (한 번에 읽기)
+            'STOP_BIT': 14,          # stop_ht
+            'CMD_WORD': None          # {'register': 주소, 'bits': {'START_BIT': n, ...}} 명령 워드(FC6), 없으면 코일(FC5)
         },
         'ROLL': {  # ANT_ROLL, EUT_ROLL, TT_ROLL 공통
             'LOCATION': {'start': 4, 'length': 3},  # 5-6번 주소 (-1 보정)
             'TARGET': {'start': 6, 'length': 3},    # 7-8번 주소 (-1 보정)
+            'START_REGISTER': None,   # TARGET 직후의 START 레지스터 (FC16 병합용, 코일만 지원 시 None)
             'SPEED': {'start': 9, 'length': 1},     # 10번 주소 (-1 보정)
             'START_BIT': 5,           # start_roll
             'ENABLE_BIT': 6,          # OutBitE3
             'COMPLETE_BIT': 7,        # InBitB3
             'CW_LIMIT_BIT': 13,       # InBitB5
             'CCW_LIMIT_BIT': 14,      # InBitB6
-            'STOP_BIT': 15           # stop_roll
+            'LIMIT_BITS': {'start': 13, 'count': 2},  # CW/CCW 연속 주소 (한 번에 읽기)
+            'STOP_BIT': 15,          # stop_roll
+            'CMD_WORD': None          # {'register': 주소, 'bits': {'START_BIT': n, ...}} 명령 워드(FC6), 없으면 코일(FC5)
         }
     }
 
 class SharedPortController:
     """공유 포트 제어를 위한 클래스"""
     
-    def __init__(self, port: str, slave_address: int = DEFAULT_SLAVE_ADDRESS):
+    def __init__(self, port: str, slave_address: int = DEFAULT_SLAVE_ADDRESS, baudrate: int = DEFAULT_BAUDRATE):
         self.port = port
         self.slave_address = slave_address
-        self.lock = threading.RLock()
+        self.baudrate = baudrate
+        self.lock = threading.Lock()  # _execute_modbus_command에서 한 번만 획득 (재진입 없음)
         self.instrument = self._setup_instrument()
 
     def _setup_instrument(self) -> Optional[minimalmodbus.Instrument]:  # self.port와 self.slave_address를 사용
         """시리얼 통신 설정"""
         try:
-            instrument = minimalmodbus.Instrument(self.port, self.slave_address)  # 클래스 변수 사용
-            instrument.serial.baudrate = 19200
-            instrument.serial.bytesize = 8
-            instrument.serial.parity = serial.PARITY_NONE
-            instrument.serial.stopbits = 1
-            instrument.serial.timeout = 2
+            # 통신 파라미터와 Software flow control 비활성화를 한 번에 적용, 버퍼 확장 및 클리어
+            instrument = _open_instrument(self.port, self.slave_address, self.baudrate, {'xonxoff': False})
             
             # 시리얼 포트 설정 추가
             instrument.serial.rts = False  # RTS 비활성화
             instrument.serial.dtr = False  # DTR 비활성화
-            instrument.serial.xonxoff = False  # Software flow control 비활성화
-            
-            # 통신 버퍼 클리어
-            instrument.serial.reset_input_buffer()
-            instrument.serial.reset_output_buffer()
             
             return instrument
         except Exception as e:
@@ -150,42 +287,154 @@ class SharedPortController:
         except Exception as e:
             logging.error(f"SharedPortController 연결 종료 중 심각한 오류: {e}")
 
-class PositionerController:
-    """포지셔너 제어 클래스"""
+class PositionerController(ABC):
+    """포지셔너 제어 기본 클래스 (높이/회전 축별 동작은 서브클래스에서 구현)"""
+    
+    REGISTER_MAP_KEY = None  # 서브클래스에서 사용할 REGISTER_MAP 키
     
-    def __init__(self, positioner_type: PositionerType, port_info: Union[str, SharedPortController], slave_address: int = DEFAULT_SLAVE_ADDRESS):
+    # 인스턴스 __dict__ 대신 고정 슬롯 사용 (폴링 경로의 속성 접근 비용 감소)
+    __slots__ = (
+        'positioner_type', 'reg_map', 'shared_port', 'port_controller',
+        'instrument', 'lock', 'position_limits', 'speed_settings',
+        '_counts_per_unit', '_min_poll_s', '_req_pos', '_req_complete', '_req_limits',
+        '_pos_cache', '_speed_cache', '_pos_cache_ttl', '_pos_min', '_pos_max', '_last_speed', '_start_pulse_s',
+        '_loc_start', '_target_start', '_speed_start',
+        '_complete_bit', '_limit_start', '_limit_count', '_silent_interval', '_start_bit_low',
+        '_with_speed', '_state_count', '_req_state', '_last_position', '_abort'
+    )
+    
+    def __init__(self, positioner_type: PositionerType, port_info: Union[str, SharedPortController], slave_address: int = DEFAULT_SLAVE_ADDRESS,
+                 pos_cache_ttl: float = 0.05, start_pulse_s: Optional[float] = None, baudrate: int = DEFAULT_BAUDRATE):
         self.positioner_type = positioner_type
-        self.constants = PositionerConstants()
-        
-        # ROLL 타입 포지셔너들은 공통 레지스터 맵 사용
-        if positioner_type in [PositionerType.ANTENNA_ROLL, PositionerType.EUT_ROLL, PositionerType.TURNTABLE_ROLL]:
-            self.reg_map = self.constants.REGISTER_MAP['ROLL']
-        else:
-            self.reg_map = self.constants.REGISTER_MAP[positioner_type.value]
+        # 마지막으로 읽은 위치 (monotonic 시각, counts) 캐시: TTL 이내의 중복 읽기 생략 (0이면 비활성)
+        self._pos_cache = (float('-inf'), None)
+        # 상태 블록에서 위치와 함께 읽은 속도 레지스터 값 (monotonic 시각, speed), 같은 TTL 적용
+        self._speed_cache = (float('-inf'), None)
+        self._pos_cache_ttl = pos_cache_ttl
+        # 상수는 클래스 속성으로 직접 참조 (인스턴스 생성 없음)
+        self.reg_map = PositionerConstants.REGISTER_MAP[self.REGISTER_MAP_KEY]
+        # 자주 쓰는 레지스터 주소는 정수 속성으로 미리 추출 (호출마다 중첩 dict 조회 생략)
+        self._loc_start = self.reg_map['LOCATION']['start']
+        self._target_start = self.reg_map['TARGET']['start']
+        self._speed_start = self.reg_map['SPEED']['start']
+        self._complete_bit = self.reg_map['COMPLETE_BIT']
+        self._limit_start = self.reg_map['LIMIT_BITS']['start']
+        self._limit_count = self.reg_map['LIMIT_BITS']['count']
+        # 상태 블록: LOCATION~SPEED 연속 구간 (속도 설정이 없는 EUT Roll은 LOCATION 2워드만)
+        self._with_speed = PositionerConstants.SPEED_SETTINGS[positioner_type.value]['DEFAULT'] is not None
+        state_end = self._speed_start if self._with_speed else self._loc_start + 1
+        self._state_count = state_end - self._loc_start + 1
             
-        # 공유 포트 또는 개별 포트 설정
+        # 공유 포트 또는 개별 포트 설정: 개별 포트도 SharedPortController로 열어 설정/종료 경로를 하나로 통일
         if isinstance(port_info, SharedPortController):
             self.shared_port = True
             self.port_controller = port_info
-            self.instrument = self.port_controller.instrument
         else:
             self.shared_port = False
-            self.instrument = minimalmodbus.Instrument(port_info, slave_address)
-            self.instrument.serial.baudrate = 19200
-            self.instrument.serial.bytesize = 8
-            self.instrument.serial.parity = serial.PARITY_NONE
-            self.instrument.serial.stopbits = 1
-            self.instrument.serial.timeout = 2
-
-        self.position_limits = self.constants.POSITION_LIMITS[positioner_type.value]
-        self.speed_settings = self.constants.SPEED_SETTINGS[positioner_type.value]
+            self.port_controller = SharedPortController(port_info, slave_address, baudrate)
+        # 물리 포트당 Instrument 하나와 락 하나 (같은 포트의 포지셔너끼리 공유)
+        self.instrument = self.port_controller.instrument
+        self.lock = self.port_controller.lock
+
+        self.position_limits = PositionerConstants.POSITION_LIMITS[positioner_type.value]
+        self.speed_settings = PositionerConstants.SPEED_SETTINGS[positioner_type.value]
+        if start_pulse_s is None:
+            start_pulse_s = PositionerConstants.START_PULSE_S[positioner_type.value]
+        self._start_pulse_s = start_pulse_s
+        # 단위(mm 또는 degree)당 카운트와 위치 범위: 매 읽기마다 dict 조회하지 않도록 한 번만 결정
+        self._counts_per_unit = float(self._unit_factor())
+        self._pos_min = self.position_limits['MIN']
+        self._pos_max = self.position_limits['MAX']
+        self._min_poll_s = self._frame_poll_interval(self.instrument)
+        # RTU 프레임 간 무통신 구간 (3.5 문자 시간, 11 bits/문자)
+        self._silent_interval = 3.5 * 11 / self.instrument.serial.baudrate if self.instrument is not None else 0.0035
+        self._build_request_frames()
+        self._last_speed = None  # 마지막으로 설정이 확인된 속도 (같은 값 재설정 생략)
+        self._start_bit_low = False  # 이 프로세스가 마지막으로 START 비트에 0을 썼는지 (초기 상태는 알 수 없음)
+        self._last_position = None  # is_moving을 idle_since 없이 호출할 때만 쓰는 직전 샘플
+        # 비상 정지 신호: 설정되면 이동 루프가 START 재전송 없이 종료 (MeasurementSystem이 모든 축에 공유 Event를 지정)
+        self._abort = threading.Event()
         
         if self.speed_settings['DEFAULT'] is not None:
             self.set_speed(self.speed_settings['DEFAULT'])
     
-    def is_movement_complete(self, target: float) -> bool:
+    @abstractmethod
+    def _unit_factor(self) -> float:
+        """단위(mm 또는 degree)당 카운트"""
+
+    @abstractmethod
+    def _warn_out_of_range(self, value: float) -> None:
+        """읽은 위치가 허용 범위를 벗어났을 때 경고 로그"""
+
+    @abstractmethod
+    def determine_shortest_path(self, current_pos: float, target_pos: float) -> float:
+        """현재 위치에서 목표까지의 실제 이동 목표값"""
+
+    @abstractmethod
+    def move_up(self) -> bool:
+        pass
+
+    @abstractmethod
+    def move_down(self) -> bool:
+        pass
+
+    def _build_request_frames(self):
+        """폴링에 쓰이는 읽기 요청 프레임을 미리 생성 (instrument가 없으면 minimalmodbus 경로 사용)"""
+        self._req_pos = self._req_complete = self._req_limits = self._req_state = None
+        if self.instrument is None:
+            return
+        slave = self.instrument.address
+        self._req_pos = _build_read_request(slave, 3, self._loc_start, 2)
+        self._req_state = _build_read_request(slave, 3, self._loc_start, self._state_count)
+        self._req_complete = _build_read_request(slave, 2, self._complete_bit, 1)
+        self._req_limits = _build_read_request(slave, 2, self._limit_start, self._limit_count)
+
+    @staticmethod
+    def _raw_transaction(instrument, request: bytes, response_length: int) -> bytes:
+        """미리 만든 요청 프레임을 직접 전송하고 응답 프레임(헤더/CRC 검증) 반환"""
+        port = instrument.serial
+        if instrument.clear_buffers_before_each_transaction:
+            port.reset_input_buffer()
+        port.write(request)
+        
+        # 예외 응답(5 bytes)을 먼저 구분한 뒤 나머지 수신
+        response = port.read(5)
+        if len(response) == 5 and response[1] == request[1] | 0x80:
+            raise IOError(f"Modbus 예외 응답: code {response[2]}")
+        response += port.read(response_length - len(response))
+        
+        if len(response) != response_length:
+            raise IOError(f"응답 길이 오류: {len(response)}/{response_length} bytes")
+        if response[:2] != request[:2]:
+            raise IOError(f"응답 헤더 오류: {response[:2].hex()}")
+        if _crc16_modbus(response[:-2]) != struct.unpack('<H', response[-2:])[0]:
+            raise IOError("응답 CRC 오류")
+        return response
+
+    @classmethod
+    def _read_registers_raw(cls, instrument, request: bytes, count: int) -> tuple:
+        """미리 만든 FC3 요청으로 레지스터 count개를 읽어 struct로 한 번에 디코드"""
+        return struct.unpack_from(f'>{count}H', cls._raw_transaction(instrument, request, 5 + 2 * count), 3)
+
+    def _read_bits_raw(self, instrument, request: bytes, count: int) -> list:
+        """미리 만든 FC2 요청으로 비트 목록 읽기"""
+        n_bytes = (count + 7) // 8
+        data = self._raw_transaction(instrument, request, 5 + n_bytes)[3:3 + n_bytes]
+        return [(data[i // 8] >> (i % 8)) & 1 for i in range(count)]
+
+    @staticmethod
+    def _frame_poll_interval(instrument, frame_bytes: int = 8, floor: float = 0.003) -> float:
+        """보레이트 기준 한 프레임 전송 시간(초)을 폴링 간격으로 사용 (최소 floor)"""
+        if instrument is None:
+            return 0.1
+        serial_port = instrument.serial
+        bits_per_byte = 1 + serial_port.bytesize + serial_port.stopbits
+        return max(floor, bits_per_byte * frame_bytes / serial_port.baudrate)
+
+    def is_movement_complete(self, target: float, current_pos: Optional[float] = None) -> bool:
         """위치와 COMPLETE_BIT를 모두 확인하여 이동 완료 여부를 판단"""
-        current_pos = self.read_position()
+        if current_pos is None:
+            current_pos = self.read_position()
         if current_pos is None:
             return False
             
@@ -193,7 +442,7 @@ class PositionerController:
         # complete_bit = self.check_completion()
         
         if position_reached:
-            logging.debug(f"{self.positioner_type.value} 목표 위치 도달: 현재={current_pos:.2f}, 목표={target:.2f}")
+            logging.debug("%s 목표 위치 도달: 현재=%.2f, 목표=%.2f", self.positioner_type.value, current_pos, target)
         # if complete_bit:
         #     logging.debug(f"{self.positioner_type.value} COMPLETE_BIT ON")
             
@@ -201,103 +450,133 @@ class PositionerController:
 
         return position_reached  # 위치만으로 판단
 
-    def is_moving(self, current_pos: float, target: float) -> bool:
-        """움직임 여부를 확인"""
-        try:
-            last_pos = getattr(self, '_last_position', current_pos)
+    def is_moving(self, current_pos: float, target: float, idle_since: Optional[float] = None) -> bool:
+        """움직임 여부를 확인 (idle_since: 마지막으로 위치 변화가 확인된 time.time() 시각)
+        
+        idle_since가 주어지면 직전 샘플과의 차이가 아니라 시간 기준으로 판단한다. 폴링 간격이 수 ms까지
+        짧아지면 감속/저속 구간에서 연속 샘플 차이가 거의 0이 되어 정지로 오판하기 때문.
+        생략하면 기존처럼 직전 호출의 위치와 비교한다.
+        """
+        # 목표에 도달했는지 확인
+        target_reached = abs(current_pos - target) < TOLERANCE
+        if idle_since is None:
+            last_pos = current_pos if self._last_position is None else self._last_position
             self._last_position = current_pos
-            
-            # 위치 변화가 있는지 확인
-            position_change = abs(current_pos - last_pos) > 0.01
-            # 목표에 도달했는지 확인
-            target_reached = abs(current_pos - target) < TOLERANCE
-            
-            return position_change and not target_reached
-            
-        except Exception as e:
-            logging.error(f"움직임 확인 중 오류: {e}")
+            return abs(current_pos - last_pos) > 0.01 and not target_reached
+        if target_reached:
             return False
+        return time.time() - idle_since < RESTART_IDLE_S
 
-    def check_position_continuously(self, target: float, start_time: float, max_wait_time: float) -> bool:
-        current_pos = self.read_position()
+    def check_position_continuously(self, target: float, start_time: float, max_wait_time: float,
+                                    current_pos: Optional[float] = None,
+                                    idle_since: Optional[float] = None) -> Tuple[bool, bool]:
+        """(타임아웃 여부, START 재전송 여부) 반환. idle_since가 주어지면 RESTART_IDLE_S 이상 정지 시 START 재전송
+        
+        재전송 판단은 여기서 한 번만 하고, 호출 측은 반환값으로 실제 재전송 시각을 기록한다.
+        """
         if current_pos is None:
-            return False
+            current_pos = self.read_position()
+        if current_pos is None:
+            return False, False
 
         # 현재 위치 로깅
-        logging.debug(f"{self.positioner_type.value} 현재 위치: {current_pos:.2f}, 목표: {target:.2f}")
+        logging.debug("%s 현재 위치: %.2f, 목표: %.2f", self.positioner_type.value, current_pos, target)
         
-        # 움직임 멈춤 감지 시 복구 시도
-        if not self.is_moving(current_pos, target):
+        # 움직임 멈춤 감지 시 복구 시도 (정지 시각을 모르거나 비상 정지 중이면 판단하지 않음)
+        if (idle_since is not None and not self._abort.is_set()
+                and not self.is_moving(current_pos, target, idle_since)):
             # START 비트 재설정 시도
             def retry_start(instrument):
-                instrument.write_bit(self.reg_map['START_BIT'], 0, 5)
-                time.sleep(0.2)
-                instrument.write_bit(self.reg_map['START_BIT'], 1, 5)
+                self._pulse_start(instrument)
                 return True
                 
-            self._execute_modbus_command(retry_start)
+            restarted = bool(self._execute_modbus_command(retry_start))
+        else:
+            restarted = False
             
         # 타임아웃 체크
         if time.time() - start_time > max_wait_time:
             logging.error(f"{self.positioner_type.value} 이동 타임아웃")
-            return True
+            return True, restarted
             
-        return False
+        return False, restarted
 
     def move_to_position(self, target: float, wait_for_completion: bool = True) -> bool:
-        """지정된 위치로 이동"""
+        """지정된 위치로 이동 (비상 정지 신호가 설정되어 있으면 명령하지 않고 False)"""
         try:
+            if self._abort.is_set():
+                logging.warning("%s 비상 정지 중이므로 이동하지 않음", self.positioner_type.value)
+                return False
             current_pos = self.read_position()
             if current_pos is None:
                 logging.error(f"{self.positioner_type.value} 현재 위치 읽기 실패")
                 return False
                 
-            # 이미 목표 위치에 있는지 확인
-            if abs(current_pos - target) < TOLERANCE:
-                logging.info(f"{self.positioner_type.value}가 이미 목표 위치({target})에 있습니다.")
+            # 이미 목표 위치에 있는지 확인 (회전축은 360° 등가 위치 포함)
+            if abs(current_pos - self.determine_shortest_path(current_pos, target)) < TOLERANCE:
+                logging.info("%s가 이미 목표 위치(%s)에 있습니다.", self.positioner_type.value, target)
                 return True
                 
-            # 타겟 위치 설정
-            if not self.set_target_position(target):
+            # 타겟 위치 계산 (이미 읽은 현재 위치 사용)
+            counts = self._target_counts(current_pos, target)
+            if counts is None:
                 logging.error(f"{self.positioner_type.value} 타겟 위치 설정 실패")
                 return False
                 
-            # 이동 시작
-            if not self.start_movement():
+            # 타겟 설정과 이동 시작을 한 번의 트랜잭션으로 전송
+            if not self.write_target_and_start(counts):
                 logging.error(f"{self.positioner_type.value} 이동 시작 실패")
                 return False
                 
             if wait_for_completion:
                 max_wait_time = 120  # 최대 대기 시간 (초)
+                stall_timeout = 5.0  # 움직임 없음 판정 시간 (초)
                 start_time = time.time()
                 last_pos = current_pos
-                no_movement_count = 0
+                last_move_time = start_time
+                last_restart_time = start_time  # START 재전송은 RESTART_IDLE_S마다 최대 한 번
                 
-                while not self.is_movement_complete(target):
-                    time.sleep(0.1)
+                # 반복마다 위치를 한 번만 읽어 완료/모니터링/정지 감지에 공유 (이동 중에는 캐시 사용 안 함)
+                current_pos = self.read_position(use_cache=False)
+                prev_sample = (current_pos, time.monotonic())
+                poll_interval = self._min_poll_s
+                while not self.is_movement_complete(target, current_pos):
+                    # 대기 중 비상 정지가 걸리면 바로 종료 (정지 명령은 emergency_stop_all이 이미 전송)
+                    if self._abort.wait(poll_interval):
+                        logging.warning("%s 비상 정지로 이동 대기 중단", self.positioner_type.value)
+                        return False
                     
                     # 현재 위치 확인 및 모니터링
-                    if self.check_position_continuously(target, start_time, max_wait_time):
+                    current_pos = self.read_position(use_cache=False)
+                    sample = (current_pos, time.monotonic())
+                    poll_interval = self._next_poll_interval(prev_sample, sample, target)
+                    prev_sample = sample
+                    
+                    # 마지막 이동 시각 갱신 (기준 위치에서 TOLERANCE 이상 벗어나면 움직인 것으로 봄)
+                    now = time.time()
+                    if current_pos is not None and abs(current_pos - last_pos) >= TOLERANCE:
+                        last_move_time = now
+                        last_pos = current_pos
+                    
+                    idle_since = max(last_move_time, last_restart_time)
+                    timed_out, restarted = self.check_position_continuously(
+                        target, start_time, max_wait_time, current_pos, idle_since)
+                    if timed_out:
                         self.stop_movement()
                         return False
+                    if restarted:
+                        last_restart_time = time.time()  # 실제로 START를 재전송한 경우에만 다음 재전송까지 대기
                         
-                    # 움직임이 멈췄는지 확인
-                    current_pos = self.read_position()
-                    if current_pos is not None:
-                        if abs(current_pos - last_pos) < TOLERANCE:
-                            no_movement_count += 1
-                            if no_movement_count > 50:  # 5초 동안 움직임이 없으면
-                                logging.error(f"{self.positioner_type.value} 움직임이 멈춤")
-                                self.stop_movement()
-                                return False
-                        else:
-                            no_movement_count = 0
-                        last_pos = current_pos
+                    # 움직임이 멈췄는지 확인 (폴링 주기와 무관하게 시간 기준)
+                    if current_pos is not None and now - last_move_time > stall_timeout:
+                        logging.error(f"{self.positioner_type.value} 움직임이 멈춤")
+                        self.stop_movement()
+                        return False
                 
-                # 최종 위치 확인
-                final_pos = self.read_position()
+                # 최종 위치 확인 (루프를 빠져나온 마지막 읽기 값이 곧 최종 위치)
+                final_pos = current_pos
                 if final_pos is not None:
-                    logging.info(f"{self.positioner_type.value} 이동 완료: {final_pos:.2f}")
+                    logging.info("%s 이동 완료: %.2f", self.positioner_type.value, final_pos)
                     return abs(final_pos - target) < TOLERANCE
                     
             return True
@@ -307,159 +586,227 @@ class PositionerController:
             self.stop_movement()
             return False
 
-    def _execute_modbus_command(self, func: Callable, max_retries: int = 3) -> Any:
-        """Modbus 명령 실행 래퍼 함수"""
+    def _next_poll_interval(self, prev_sample: tuple, sample: tuple, target: float) -> float:
+        """관측 속도로 남은 시간을 추정해 폴링 간격 결정 (멀면 길게, 목표 근처는 프레임 시간까지 짧게)"""
+        (prev_pos, prev_time), (pos, now) = prev_sample, sample
+        if pos is None or prev_pos is None or now <= prev_time:
+            return self._min_poll_s
+        velocity = abs(pos - prev_pos) / (now - prev_time)
+        if velocity <= 0:
+            return self._min_poll_s
+        # 남은 예상 시간의 30%만 대기하여 목표 도달 직후를 놓치지 않음
+        remaining_time = abs(target - pos) / velocity
+        return min(MAX_POLL_INTERVAL, max(self._min_poll_s, 0.3 * remaining_time))
+
+    def _execute_modbus_command(self, func: Callable, *args, max_retries: int = 3) -> Any:
+        """Modbus 명령 실행 래퍼 함수 (func(instrument, *args) 호출)"""
+        # 공유 포트도 생성 시 port_controller.instrument를 self.instrument에 바인딩하므로 분기 없이 한 번만 조회
+        instrument = self.instrument
+        if instrument is None:
+            if _log_limiter.allow(('failed', self.positioner_type)):
+                logging.error("Modbus 통신 실패: Instrument not initialized")
+            return None
+
         last_error = None
         for attempt in range(max_retries):
             try:
-                with self.port_controller.lock if self.shared_port else nullcontext():
-                    instrument = self.port_controller.instrument if self.shared_port else self.instrument
-                    if instrument is None:
-                        raise Exception("Instrument not initialized")
-                        
-                    # 통신 설정 재확인
-                    instrument.serial.timeout = 1.0  # 짧은 타임아웃 설정
-                    instrument.serial.reset_input_buffer()
-                    instrument.serial.reset_output_buffer()
+                with self.lock:
+                    if attempt > 0:
+                        # 재시도일 때만 직전 실패 시도의 잔여 응답 제거 (송신 버퍼는 이미 전송 완료)
+                        instrument.serial.reset_input_buffer()
                     
-                    result = func(instrument)
-                    if result is not None or isinstance(result, bool):
+                    result = func(instrument, *args)
+                    if result is not None:  # False도 유효한 결과
                         return result
                         
             except Exception as e:
                 last_error = e
-                logging.warning(f"통신 시도 {attempt + 1}/{max_retries} 실패: {e}")
-                time.sleep(0.2 * (attempt + 1))  # 점진적 대기 시간 증가
-                continue
+                if _log_limiter.allow(('retry', self.positioner_type)):
+                    logging.warning("통신 시도 %d/%d 실패: %s", attempt + 1, max_retries, e)
+            
+            # 짧은 지수 백오프 (10ms, 20ms, ...): 일시적 노이즈는 수십 ms 대기 후 재시도로 충분
+            if attempt + 1 < max_retries:
+                time.sleep(max(self._silent_interval, 0.01 * (1 << attempt)))
                 
-        if last_error is not None:
+        if last_error is not None and _log_limiter.allow(('failed', self.positioner_type)):
             if "illegal data address" in str(last_error).lower():
-                logging.error(f"Modbus 주소 오류: {last_error}")
+                logging.error("Modbus 주소 오류: %s", last_error)
             else:
-                logging.error(f"Modbus 통신 실패: {last_error}")
+                logging.error("Modbus 통신 실패: %s", last_error)
         return None
 
-    def read_raw_location(self) -> Optional[int]:
-        def execute(instrument):
-            reg_info = self.reg_map['LOCATION']
-            try:
-                # 실제 값 읽기
-                raw_value = instrument.read_long(reg_info['start'], 3, False, reg_info['length'])                
-                return raw_value
-            except Exception as e:
-                logging.error(f"{self.positioner_type.value} 위치 읽기 실패: {type(e).__name__} - {e}")
-                return None
-        return self._execute_modbus_command(execute)
+    def _invalidate_position_cache(self):
+        self._pos_cache = (float('-inf'), None)
+
+    def read_raw_location(self, use_cache: bool = True) -> Optional[int]:
+        if use_cache and self._pos_cache_ttl > 0:
+            timestamp, counts = self._pos_cache
+            if counts is not None and time.monotonic() - timestamp < self._pos_cache_ttl:
+                return counts
+
+        # 호출마다 클로저를 만들지 않도록 메서드를 직접 전달
+        counts = self._execute_modbus_command(self._read_location_once)
+        if counts is not None:
+            self._pos_cache = (time.monotonic(), counts)
+        return counts
+
+    def _read_location_once(self, instrument) -> Optional[int]:
+        """LOCATION 레지스터 1회 읽기 (_execute_modbus_command에서 호출)"""
+        try:
+            # 실제 값 읽기
+            # byteorder 3 (워드 스왑): 하위 워드가 먼저 옴
+            if self._req_pos is not None:
+                low, high = struct.unpack('>HH', self._raw_transaction(instrument, self._req_pos, 9)[3:7])
+            else:
+                # read_long의 payload 디코더 대신 레지스터 2개를 읽어 직접 조합 (unsigned)
+                low, high = instrument.read_registers(self._loc_start, 2, 3)
+            return (high << 16) | low
+        except Exception as e:
+            if _log_limiter.allow(('read_location', self.positioner_type)):
+                logging.error("%s 위치 읽기 실패: %s - %s", self.positioner_type.value, type(e).__name__, e)
+            return None
 
     def write_raw_location(self, counts: int) -> bool:
-        def execute(instrument):
-            reg_info = self.reg_map['LOCATION']
-            # 수정: (address, value, functioncode, signed)
-            instrument.write_long(reg_info['start'], counts, 3, False)
-            return True
-        return self._execute_modbus_command(execute)
+        self._invalidate_position_cache()
+        return self._execute_modbus_command(self._write_location_once, counts)
+
+    def _write_location_once(self, instrument, counts: int) -> bool:
+        """LOCATION 레지스터 1회 쓰기 (_execute_modbus_command에서 호출)"""
+        instrument.write_long(self._loc_start, counts, signed=False, byteorder=LONG_BYTEORDER)
+        return True
 
     def convert_to_counts(self, value: float) -> int:
-        if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
-            return int(value * self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM'])
-        else:
-            return int(value * self.constants.STEPS_PER_DEGREE[self.positioner_type.value])
+        return int(value * self._counts_per_unit)
+
+    def convert_to_counts_batch(self, values) -> np.ndarray:
+        """여러 목표 값(mm 또는 degree)을 한 번에 카운트 배열로 변환 (convert_to_counts와 동일하게 0 방향 절삭)"""
+        return (np.asarray(values, dtype=float) * self._counts_per_unit).astype(np.int64)
 
     def convert_from_counts(self, counts: int) -> float:
         try:
-            if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
-                return counts / self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM']  # 8960 counts/mm
-            else:
-                # Roll 타입에 따른 변환
-                steps_per_degree = self.constants.STEPS_PER_DEGREE[self.positioner_type.value]
-                return counts / steps_per_degree
+            return counts / self._counts_per_unit  # 높이: 8960 counts/mm, 회전: 타입별 steps/degree
         except Exception as e:
             logging.error(f"Count 변환 중 오류 발생: {e}")
             return counts  # 에러 발생시 원래 값 반환
 
-    def read_position(self) -> Optional[float]:
+    def read_position(self, use_cache: bool = True) -> Optional[float]:
         try:
-            raw_counts = self.read_raw_location()
+            raw_counts = self.read_raw_location(use_cache)
             if raw_counts is not None:
-         
-                if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
-                    # 높이 변환 (8960 counts/mm)
-                    mm_value = raw_counts / self.constants.HEIGHT_CONSTANTS['COUNTS_PER_MM']
-                    if not (self.position_limits['MIN'] <= mm_value <= self.position_limits['MAX']):
-                        logging.warning(f"높이 값이 범위를 벗어남: {mm_value}mm")
-                    return mm_value
-                else:
-                    # 각도 변환
-                    steps_per_degree = self.constants.STEPS_PER_DEGREE[self.positioner_type.value]
-                    angle = raw_counts / steps_per_degree
-                    if not (self.position_limits['MIN'] <= angle <= self.position_limits['MAX']):
-                        logging.warning(f"각도 값이 범위를 벗어남: {angle}°")
-                    return angle
+                return self._position_from_counts(raw_counts)
                 
             return None
         except Exception as e:
-            logging.error(f"위치 읽기 중 오류 발생: {e}")
+            if _log_limiter.allow(('read_position', self.positioner_type)):
+                logging.error("위치 읽기 중 오류 발생: %s", e)
             return None
 
+    def _position_from_counts(self, raw_counts: int) -> float:
+        """카운트를 위치(mm 또는 degree)로 변환하고 범위를 벗어나면 경고"""
+        value = raw_counts / self._counts_per_unit
+        if not (self._pos_min <= value <= self._pos_max):
+            self._warn_out_of_range(value)
+        return value
+
+    def _state_from_registers(self, registers: list, base: int, with_speed: bool = True) -> Dict[str, Optional[float]]:
+        """base 주소부터 연속으로 읽은 레지스터에서 위치/속도 추출 (byteorder 3: 하위 워드 먼저)"""
+        offset = self._loc_start - base
+        counts = (registers[offset + 1] << 16) | registers[offset]
+        speed = registers[self._speed_start - base] if with_speed else None
+        now = time.monotonic()
+        self._pos_cache = (now, counts)
+        if with_speed:
+            self._speed_cache = (now, speed)
+        return {
+            'position': self._position_from_counts(counts),
+            'speed': speed
+        }
+
+    def _cached_state(self) -> Optional[Dict[str, Optional[float]]]:
+        """TTL 이내에 장비에서 읽은 위치와 속도 레지스터 값 (둘 중 하나라도 오래됐으면 None)"""
+        now = time.monotonic()
+        timestamp, counts = self._pos_cache
+        if counts is None or now - timestamp >= self._pos_cache_ttl:
+            return None
+        speed = None
+        if self._with_speed:
+            speed_timestamp, speed = self._speed_cache
+            if speed is None or now - speed_timestamp >= self._pos_cache_ttl:
+                return None
+        return {
+            'position': self._position_from_counts(counts),
+            'speed': speed
+        }
+
+    def read_bulk_state(self) -> Dict[str, Optional[float]]:
+        """위치와 속도를 LOCATION~SPEED 구간 한 번의 FC3 요청으로 읽기 (EUT Roll은 위치만)"""
+        def execute(instrument):
+            if self._req_state is not None:
+                return self._read_registers_raw(instrument, self._req_state, self._state_count)
+            return instrument.read_registers(self._loc_start, self._state_count, 3)
+        registers = self._execute_modbus_command(execute)
+        if registers is None:
+            return {'position': None, 'speed': None}
+        return self._state_from_registers(registers, self._loc_start, self._with_speed)
+
     def read_speed(self) -> Optional[int]:
         """현재 속도를 읽는 함수"""
         def execute(instrument):
-            if self.positioner_type == PositionerType.EUT_ROLL:
+            if self.positioner_type is PositionerType.EUT_ROLL:
                 return None  # EUT Roll은 속도 설정 불가
                     
-            reg_info = self.reg_map['SPEED']
             try:
-                logging.debug(f"{self.positioner_type.value} read_speed 파라미터:")
-                logging.debug(f"- address (start): {reg_info['start']}")                
-                speed = self.instrument.read_register(reg_info['start'])
-                logging.debug(f"{self.positioner_type.value} 읽은 speed: {speed} (hex: {hex(speed)})")
+                speed = instrument.read_register(self._speed_start)
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("%s read_speed address: %s", self.positioner_type.value, self._speed_start)
+                    logging.debug("%s 읽은 speed: %s (hex: %#x)", self.positioner_type.value, speed, speed)
                 return speed
             except Exception as e:
-                logging.error(f"{self.positioner_type.value} 속도 읽기 실패: {e}")
+                if _log_limiter.allow(('read_speed', self.positioner_type)):
+                    logging.error("%s 속도 읽기 실패: %s", self.positioner_type.value, e)
                 return None
         return self._execute_modbus_command(execute)
 
-    def determine_shortest_path(self, current_pos: float, target_pos: float) -> float:
-        if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
-            return target_pos
+    def _target_counts(self, current_pos: float, target: float) -> Optional[int]:
+        """최단 경로와 범위를 반영한 타겟 카운트 계산 (범위 초과 시 None)"""
+        optimized_target = self.determine_shortest_path(current_pos, target)
             
-        diff = target_pos - current_pos
-        
-        if diff > 180:
-            return current_pos - (360 - diff)
-        elif diff < -180:
-            return current_pos + (360 + diff)
-        return target_pos
+        if not (self._pos_min <= optimized_target <= self._pos_max):
+            logging.error(
+                f"{self.positioner_type.value} 위치 값 범위 초과: "
+                f"{optimized_target} (허용범위: {self.position_limits['MIN']} ~ {self.position_limits['MAX']})"
+            )
+            return None
 
-    def set_target_position(self, target: float) -> bool:
-        def execute(instrument):            
+        return self.convert_to_counts(optimized_target)
+
+    def set_target_position(self, target: float, current_pos: Optional[float] = None) -> bool:
+        # 호출자가 이미 읽은 현재 위치가 있으면 재사용, 없을 때만 락 밖에서 먼저 읽음 (포트 락은 재진입 불가)
+        if current_pos is None:
             current_pos = self.read_position()
-            print(f"{self.positioner_type.value} - 현재 위치: {current_pos}")
+            logging.debug("%s - 현재 위치: %s", self.positioner_type.value, current_pos)
             if current_pos is None:
                 return False
-            
-            optimized_target = self.determine_shortest_path(current_pos, target)
-                
-            if not (self.position_limits['MIN'] <= optimized_target <= self.position_limits['MAX']):
-                logging.error(
-                    f"{self.positioner_type.value} 위치 값 범위 초과: "
-                    f"{optimized_target} (허용범위: {self.position_limits['MIN']} ~ {self.position_limits['MAX']})"
-                )
-                return False
-
-            counts = self.convert_to_counts(optimized_target)
+        
+        counts = self._target_counts(current_pos, target)
+        if counts is None:
+            return False
 
-            reg_info = self.reg_map['TARGET']
-            instrument.write_long(reg_info['start'], counts, False, 3)
-            logging.debug(f"{self.positioner_type.value} target set to: {counts}")
+        def execute(instrument):
+            instrument.write_long(self._target_start, counts, signed=False, byteorder=LONG_BYTEORDER)
+            self._invalidate_position_cache()
+            logging.debug("%s target set to: %s", self.positioner_type.value, counts)
 
             return True
 
         return self._execute_modbus_command(execute)
 
     def set_speed(self, speed: int) -> bool:
+        if speed == self._last_speed:
+            return True
+            
         def execute(instrument):
-            if self.positioner_type == PositionerType.EUT_ROLL:
+            if self.positioner_type is PositionerType.EUT_ROLL:
                 logging.error("EUT Roll은 속도 설정이 불가능합니다")
                 return False
                 
@@ -470,34 +817,80 @@ class PositionerController:
                 )
                 return False
 
-            reg_info = self.reg_map['SPEED']
-            instrument.write_register(reg_info['start'], speed)
-            time.sleep(0.5)  # 안정화를 위한 대기
-
+            instrument.write_register(self._speed_start, speed)
+            self._speed_cache = (float('-inf'), None)  # 장비 값이 바뀌었으므로 캐시된 속도 무효화
+            
+            # 고정 0.5초 대기 대신 다시 읽어서 반영 확인 (최대 3회, 20ms 간격)
+            for _ in range(3):
+                if instrument.read_register(self._speed_start) == speed:
+                    self._last_speed = speed
+                    return True
+                time.sleep(0.02)
+            logging.warning(f"{self.positioner_type.value} 속도 설정 확인 실패: {speed}")
             return True
         return self._execute_modbus_command(execute)
 
+    def _write_control_bit(self, instrument, bit_name: str, value: int) -> None:
+        """제어 비트 쓰기: 명령 워드가 정의된 장비는 FC6 한 번, 아니면 코일(FC5) 한 번"""
+        cmd_word = self.reg_map['CMD_WORD']
+        if cmd_word is not None:
+            instrument.write_register(cmd_word['register'], value << cmd_word['bits'][bit_name], functioncode=6)
+        else:
+            instrument.write_bit(self.reg_map[bit_name], value, 5)
+
+    def _clear_start_bit(self, instrument):
+        """START 비트를 0으로 쓰고 상태 기록 (다음 시작 시 초기화 단계 생략)"""
+        self._write_control_bit(instrument, 'START_BIT', 0)
+        self._start_bit_low = True
+
+    def _pulse_start(self, instrument):
+        """START 비트 0 -> 1 펄스 전송 (이미 0으로 내려 둔 경우 1만 써서 상승 에지 생성)"""
+        if not self._start_bit_low:
+            # 먼저 START 비트를 0으로 초기화
+            self._write_control_bit(instrument, 'START_BIT', 0)
+            time.sleep(self._start_pulse_s)
+        # 그 다음 1로 설정 (쓰기 실패 시 상태를 알 수 없으므로 먼저 플래그 해제)
+        self._start_bit_low = False
+        self._write_control_bit(instrument, 'START_BIT', 1)
+
     def start_movement(self) -> bool:
+        self._invalidate_position_cache()
         def execute(instrument):
             try:
-                # 먼저 START 비트를 0으로 초기화
-                instrument.write_bit(self.reg_map['START_BIT'], 0, 5)
-                time.sleep(0.2)
-                # 그 다음 1로 설정
-                instrument.write_bit(self.reg_map['START_BIT'], 1, 5)
-                logging.debug(f"{self.positioner_type.value} movement started")
+                self._pulse_start(instrument)
+                logging.debug("%s movement started", self.positioner_type.value)
                 return True
             except Exception as e:
                 logging.error(f"동작 시작 중 오류: {e}")
                 return False
         return self._execute_modbus_command(execute)
 
+    def write_target_and_start(self, counts: int) -> bool:
+        """타겟 위치 쓰기와 이동 시작을 한 번의 Modbus 트랜잭션으로 처리
+        
+        START_REGISTER가 TARGET 바로 뒤에 있는 장비는 FC16 한 프레임으로 전송하고,
+        START가 코일(FC5)인 장비는 같은 락 안에서 연속으로 전송한다.
+        """
+        self._invalidate_position_cache()
+        def execute(instrument):
+            start_register = self.reg_map['START_REGISTER']
+            if start_register is not None and start_register == self._target_start + 2:
+                # byteorder 3 (워드 스왑): 하위 워드 먼저
+                low, high = counts & 0xFFFF, (counts >> 16) & 0xFFFF
+                instrument.write_registers(self._target_start, [low, high, 1])
+            else:
+                instrument.write_long(self._target_start, counts, signed=False, byteorder=LONG_BYTEORDER)
+                self._pulse_start(instrument)
+            logging.debug("%s target set to: %s, movement started", self.positioner_type.value, counts)
+            return True
+        return self._execute_modbus_command(execute)
+
     def stop_movement(self) -> bool:
         def execute(instrument):
             try:
                 # STOP_BIT 사용하지 않고 START 비트만 초기화
-                instrument.write_bit(self.reg_map['START_BIT'], 0, 5)
-                time.sleep(0.1)  # 짧은 대기 시간
+                self._clear_start_bit(instrument)
+                time.sleep(self._start_pulse_s)  # 최소 펄스 폭만큼 대기
                 return True
             except Exception as e:
                 logging.error(f"{self.positioner_type.value} 동작 정지 중 오류: {e}")
@@ -506,21 +899,22 @@ class PositionerController:
 
     def check_completion(self) -> bool:
         def execute(instrument):
-            value = instrument.read_bit(self.reg_map['COMPLETE_BIT'], 2)
-            print(f"COMPLETE_BIT read: {value}")
+            if self._req_complete is not None:
+                value = self._read_bits_raw(instrument, self._req_complete, 1)[0]
+            else:
+                value = instrument.read_bit(self._complete_bit, 2)
+            logging.debug("%s COMPLETE_BIT read: %s", self.positioner_type.value, value)
             return bool(value)
         return self._execute_modbus_command(execute)
 
     def check_limits(self) -> bool:
         def execute(instrument):
-            if self.positioner_type == PositionerType.ANTENNA_HEIGHT:
-                upper = instrument.read_bit(self.reg_map['UPPER_LIMIT_BIT'], 2)
-                lower = instrument.read_bit(self.reg_map['LOWER_LIMIT_BIT'], 2)
-                return not (upper or lower)
+            # 두 리미트 비트(UPPER/LOWER 또는 CW/CCW)를 한 번의 요청으로 읽음
+            if self._req_limits is not None:
+                limit_bits = self._read_bits_raw(instrument, self._req_limits, self._limit_count)
             else:
-                cw = instrument.read_bit(self.reg_map['CW_LIMIT_BIT'], 2)
-                ccw = instrument.read_bit(self.reg_map['CCW_LIMIT_BIT'], 2)
-                return not (cw or ccw)
+                limit_bits = instrument.read_bits(self._limit_start, self._limit_count, 2)
+            return not any(limit_bits)
         return self._execute_modbus_command(execute)
 
     # PositionerController 클래스 내에 다음 메소드를 추가
@@ -534,7 +928,7 @@ class PositionerController:
             # 2. START 비트 초기화
             def reset_start_bit(instrument):
                 try:
-                    instrument.write_bit(self.reg_map['START_BIT'], 0, 5)
+                    self._clear_start_bit(instrument)
                     return True
                 except Exception as e:
                     logging.warning(f"START 비트 초기화 실패: {e}")
@@ -552,20 +946,6 @@ class PositionerController:
         except Exception as e:
             logging.error(f"{self.positioner_type.value} 연결 종료 중 오류: {e}")
 
-    def move_up(self) -> bool:
-        if self.positioner_type != PositionerType.ANTENNA_HEIGHT:
-            return False
-        def execute(instrument):
-            return instrument.write_bit(self.reg_map['UP_BIT'], 1, 5)
-        return self._execute_modbus_command(execute)
-
-    def move_down(self) -> bool:
-        if self.positioner_type != PositionerType.ANTENNA_HEIGHT:
-            return False
-        def execute(instrument):
-            return instrument.write_bit(self.reg_map['DOWN_BIT'], 1, 5)
-        return self._execute_modbus_command(execute)
-
     def calibrate_position(self, value: float) -> bool:
         """현재 위치를 지정된 값으로 보정
         
@@ -589,59 +969,165 @@ class PositionerController:
             
             def execute(instrument):
                 # LOCATION 레지스터에 직접 쓰기
-                reg_info = self.reg_map['LOCATION']
-                instrument.write_long(reg_info['start'], counts, False,3)
-                time.sleep(0.2)  # 안정화 대기
+                instrument.write_long(self._loc_start, counts, signed=False, byteorder=LONG_BYTEORDER)
+                return True
                 
-                # 쓰기 성공 여부 확인
-                read_value = self.read_position()
-                if read_value is not None:
-                    success = abs(read_value - value) < TOLERANCE
-                    if success:
-                        logging.info(f"{self.positioner_type.value} 캘리브레이션 완료: {value}")
-                    else:
-                        logging.error(
-                            f"{self.positioner_type.value} 캘리브레이션 실패 - "
-                            f"설정값: {value}, 읽은값: {read_value}"
-                        )
-                    return success
+            if not self._execute_modbus_command(execute):
                 return False
-                    
-            return self._execute_modbus_command(execute)
+            self._invalidate_position_cache()
+            time.sleep(0.2)  # 안정화 대기
+            
+            # 쓰기 성공 여부 확인 (락을 놓은 뒤 별도 명령으로 읽기)
+            read_value = self.read_position(use_cache=False)
+            if read_value is not None:
+                success = abs(read_value - value) < TOLERANCE
+                if success:
+                    logging.info(f"{self.positioner_type.value} 캘리브레이션 완료: {value}")
+                else:
+                    logging.error(
+                        f"{self.positioner_type.value} 캘리브레이션 실패 - "
+                        f"설정값: {value}, 읽은값: {read_value}"
+                    )
+                return success
+            return False
             
         except Exception as e:
             logging.error(f"{self.positioner_type.value} 캘리브레이션 중 오류 발생: {e}")
             return False
         
+class HeightPositioner(PositionerController):
+    """안테나 높이 포지셔너 (mm 단위)"""
+    
+    REGISTER_MAP_KEY = 'ANT_HEIGHT'
+    __slots__ = ()
+
+    def _unit_factor(self) -> float:
+        return PositionerConstants.HEIGHT_CONSTANTS['COUNTS_PER_MM']  # 8960 counts/mm
+
+    def _warn_out_of_range(self, value: float) -> None:
+        if _log_limiter.allow(('out_of_range', self.positioner_type)):
+            logging.warning("높이 값이 범위를 벗어남: %smm", value)
+
+    def determine_shortest_path(self, current_pos: float, target_pos: float) -> float:
+        return target_pos
+
+    def move_up(self) -> bool:
+        def execute(instrument):
+            # write_bit은 None을 반환하므로 True를 명시 (None이면 재시도되어 같은 코일을 3번 씀)
+            self._write_control_bit(instrument, 'UP_BIT', 1)
+            return True
+        return self._execute_modbus_command(execute)
+
+    def move_down(self) -> bool:
+        def execute(instrument):
+            self._write_control_bit(instrument, 'DOWN_BIT', 1)
+            return True
+        return self._execute_modbus_command(execute)
+
+
+class RollPositioner(PositionerController):
+    """회전 포지셔너 (ANT_ROLL, EUT_ROLL, TT_ROLL 공통, degree 단위)"""
+    
+    REGISTER_MAP_KEY = 'ROLL'
+    __slots__ = ()
+
+    def _unit_factor(self) -> float:
+        return PositionerConstants.STEPS_PER_DEGREE[self.positioner_type.value]
+
+    def _warn_out_of_range(self, value: float) -> None:
+        if _log_limiter.allow(('out_of_range', self.positioner_type)):
+            logging.warning("각도 값이 범위를 벗어남: %s°", value)
+
+    def determine_shortest_path(self, current_pos: float, target_pos: float) -> float:
+        # 모듈러 거리로 [-180, 180) 범위의 최단 이동량 계산 (diff == ±180도 한 가지 규칙으로 처리)
+        shortest = current_pos + (target_pos - current_pos + 180.0) % 360.0 - 180.0
+        if self._pos_min <= shortest <= self._pos_max:
+            return shortest
+        # 허용 범위를 벗어나면 한 바퀴 차이 나는 등가 위치 사용 (없으면 요청 값 그대로)
+        for alternative in (shortest + 360.0, shortest - 360.0):
+            if self._pos_min <= alternative <= self._pos_max:
+                return alternative
+        return target_pos
+
+    def move_up(self) -> bool:
+        return False  # 회전축은 상하 이동 없음
+
+    def move_down(self) -> bool:
+        return False
+
+
+def create_positioner(positioner_type: PositionerType, port_info: Union[str, SharedPortController],
+                      slave_address: int = DEFAULT_SLAVE_ADDRESS, pos_cache_ttl: float = 0.05,
+                      start_pulse_s: Optional[float] = None, baudrate: int = DEFAULT_BAUDRATE) -> PositionerController:
+    """포지셔너 타입에 맞는 컨트롤러 생성"""
+    positioner_class = HeightPositioner if positioner_type is PositionerType.ANTENNA_HEIGHT else RollPositioner
+    return positioner_class(positioner_type, port_info, slave_address, pos_cache_ttl, start_pulse_s, baudrate)
+
+
 class MeasurementSystem:
-    def __init__(self, ports: Dict[str, str]):
+    __slots__ = (
+        'antenna_port_controller', 'antenna_roll', 'antenna_height',
+        'eut_roll', 'turntable_roll', '_executor', '_stop_executor', '_cleaned', '_abort', '_antenna_block', '_open_serials',
+        '_poller_stop', '_poller_threads', '_poller_saved_ttl'
+    )
+
+    def __init__(self, ports: Dict[str, str], baudrate: int = DEFAULT_BAUDRATE):
         # Antenna용 공유 포트 컨트롤러 생성
-        self.antenna_port_controller = SharedPortController(ports['ANT_ROLL'])  # ANT_ROLL과 ANT_HEIGHT가 같은 포트 사용
+        self.antenna_port_controller = SharedPortController(ports['ANT_ROLL'], baudrate=baudrate)  # ANT_ROLL과 ANT_HEIGHT가 같은 포트 사용
 
         # 포지셔너 컨트롤러 생성
-        self.antenna_roll = PositionerController(
+        self.antenna_roll = create_positioner(
             PositionerType.ANTENNA_ROLL, 
             self.antenna_port_controller  # 공유 포트 사용
         )
-        self.antenna_height = PositionerController(
+        self.antenna_height = create_positioner(
             PositionerType.ANTENNA_HEIGHT, 
             self.antenna_port_controller  # 공유 포트 사용
         )
-        self.eut_roll = PositionerController(
+        self.eut_roll = create_positioner(
             PositionerType.EUT_ROLL, 
-            ports['EUT_ROLL']  # 개별 포트 사용
+            ports['EUT_ROLL'], baudrate=baudrate  # 개별 포트 사용
         )
-        self.turntable_roll = PositionerController(
+        self.turntable_roll = create_positioner(
             PositionerType.TURNTABLE_ROLL, 
-            ports['TT_ROLL']  # 개별 포트 사용
+            ports['TT_ROLL'], baudrate=baudrate  # 개별 포트 사용
         )
         
+        # 물리 포트(안테나 공유, EUT, 턴테이블)마다 작업자 1개: 포트 간 동시 통신, 포트 내 순서는 락으로 보장
+        # 실제로 열린 시리얼 포트 목록 (비상 정리 시 속성 탐색 없이 순서대로 닫기)
+        self._open_serials = [
+            port_controller.instrument.serial
+            for port_controller in (self.antenna_port_controller,
+                                    self.eut_roll.port_controller,
+                                    self.turntable_roll.port_controller)
+            if port_controller.instrument is not None
+        ]
+        
+        # 안테나 두 축의 LOCATION~SPEED를 포함하는 연속 구간 (start, count, 미리 만든 요청 프레임)
+        start = min(self.antenna_height._loc_start, self.antenna_roll._loc_start)
+        count = max(self.antenna_height._speed_start, self.antenna_roll._speed_start) - start + 1
+        instrument = self.antenna_port_controller.instrument
+        request = _build_read_request(instrument.address, 3, start, count) if instrument is not None else None
+        self._antenna_block = (start, count, request)
+        
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="positioner")
+        self._stop_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="positioner-stop")
+        self._cleaned = False
+        # 시스템 전체 비상 정지 신호: 네 축이 같은 Event를 공유 (다음 이동 명령에서 해제)
+        self._abort = threading.Event()
+        for controller in (self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll):
+            controller._abort = self._abort
+        # 백그라운드 위치 폴러 (start_position_poller로 시작)
+        self._poller_stop = None
+        self._poller_threads = []
+        self._poller_saved_ttl = {}
+        
     def initialize_all(self) -> bool:
-        """모든 포트 컨트롤러와 instrument 초기화 상태 확인"""
-        return (self.antenna_roll.instrument is not None and 
-                self.antenna_height.instrument is not None and 
-                self.eut_roll.instrument is not None and 
-                self.turntable_roll.instrument is not None)
+        """모든 포트 컨트롤러와 instrument 초기화 상태 확인 (포트는 __init__에서 이미 열려 있으므로 재설정하지 않음)"""
+        return all(
+            controller.instrument is not None
+            for controller in (self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll)
+        )
         
     def move_to_measurement_position(self, 
                                    ant_roll_deg: float,
@@ -650,119 +1136,283 @@ class MeasurementSystem:
                                    tt_roll_deg: float,
                                    wait_for_completion: bool = True) -> bool:
         try:
-            # 순차적 이동 실행
-            moves = [
-                (self.antenna_roll, ant_roll_deg),
-                (self.turntable_roll, tt_roll_deg),
-                (self.eut_roll, eut_roll_deg),
-                (self.antenna_height, ant_height_mm)  # 높이 먼저 조정
-
-            ]
-            
-            for controller, target in moves:
-                print(f"\n{controller.positioner_type.value} 이동 시작: {target}")
-                # 이동 전 통신 상태 확인
-                current_pos = controller.read_position()
-                if current_pos is None:
-                    logging.error(f"{controller.positioner_type.value} 통신 오류")
-                    return False
-                    
-                if not controller.move_to_position(target, wait_for_completion):
-                    logging.error(f"{controller.positioner_type.value} 이동 실패")
-                    return False
-                    
-                # 이동 후 대기 시간 추가
-                time.sleep(0.5)
-            
-            return True
+            self._abort.clear()  # 새 이동 명령은 이전 비상 정지를 해제
+            return self._run_lanes(
+                self._build_lanes(ant_roll_deg, ant_height_mm, eut_roll_deg, tt_roll_deg),
+                wait_for_completion
+            )
             
         except Exception as e:
             logging.error(f"측정 위치 이동 오류: {e}")
             return False
+
+    def _build_lanes(self, ant_roll_deg, ant_height_mm, eut_roll_deg, tt_roll_deg, previous=None):
+        """물리 포트별 이동 순서 구성: 안테나 포트(높이 -> 회전)는 순차, EUT/턴테이블 포트는 각각 독립
+        
+        previous(직전 목표 튜플)가 주어지면 목표가 바뀌지 않은 축은 제외한다.
+        """
+        targets = (ant_roll_deg, ant_height_mm, eut_roll_deg, tt_roll_deg)
+        axes = (self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll)
+        moves = {
+            controller: target
+            for i, (controller, target) in enumerate(zip(axes, targets))
+            if previous is None or previous[i] != target
+        }
+        lanes = [
+            [self.antenna_height, self.antenna_roll],  # 공유 포트: 높이 먼저 조정
+            [self.eut_roll],
+            [self.turntable_roll]
+        ]
+        return [[(c, moves[c]) for c in lane if c in moves] for lane in lanes]
+
+    def _run_lane(self, moves, wait_for_completion: bool) -> bool:
+        """한 포트의 축들을 순서대로 이동 (실패 시 같은 포트의 남은 이동 중단)"""
+        for controller, target in moves:
+            if not self._move_single(controller, target, wait_for_completion):
+                return False
+            # 이동 후 안정화 대기 (완료를 기다리지 않으면 다음 축 시작을 늦출 이유가 없음)
+            if wait_for_completion:
+                time.sleep(SETTLE_TIME)
+        return True
+
+    def _run_lanes(self, lanes, wait_for_completion: bool) -> bool:
+        """포트별 이동을 동시에 실행하고 모두 끝날 때까지 대기 (이동할 축이 없는 포트는 생략)
+        
+        나머지 포트를 작업자에 먼저 넘긴 뒤 첫 포트는 호출 스레드에서 직접 실행해
+        모든 포트의 START 명령이 거의 동시에 나가도록 한다.
+        """
+        active = [moves for moves in lanes if moves]
+        if not active:
+            return True
+        futures = [
+            self._executor.submit(self._run_lane, moves, wait_for_completion)
+            for moves in active[1:]
+        ]
+        first = self._run_lane(active[0], wait_for_completion)
+        return all([first] + [future.result() for future in futures])
+
+    def move_sweep(self, positions, wait_for_completion: bool = True):
+        """측정 위치 목록을 순서대로 이동하며 각 위치 도달 시 (인덱스, 성공 여부)를 yield
+        
+        Args:
+            positions: (ant_roll_deg, ant_height_mm, eut_roll_deg, tt_roll_deg) 튜플 목록 또는 (N, 4) 배열
+            
+        직전 위치와 목표가 같은 축은 이동 명령, 위치 읽기, 안정화 대기를 모두 생략한다
+        (예: 높이 고정 각도 스윕에서는 높이 축을 다시 명령하지 않음).
+        스윕 도중 emergency_stop_all이 호출되면 해당 위치를 실패로 yield한 뒤 종료한다.
+        """
+        self._abort.clear()  # 새 스윕은 이전 비상 정지를 해제
+        previous = None
+        for index, target in enumerate(np.asarray(positions, dtype=float).reshape(-1, 4)):
+            target = tuple(target.tolist())
+            try:
+                success = self._run_lanes(self._build_lanes(*target, previous=previous), wait_for_completion)
+            except Exception as e:
+                logging.error(f"측정 위치 이동 오류: {e}")
+                success = False
+            # 실패하면 다음 스텝에서 모든 축을 다시 명령
+            previous = target if success else None
+            yield index, success
+            if self._abort.is_set():
+                return
+
+    @staticmethod
+    def _move_single(controller: PositionerController, target: float, wait_for_completion: bool) -> bool:
+        """단일 포지셔너 이동 (통신 상태 확인은 move_to_position의 현재 위치 읽기로 대신함)"""
+        print(f"\n{controller.positioner_type.value} 이동 시작: {target}")
+        if not controller.move_to_position(target, wait_for_completion):
+            logging.error(f"{controller.positioner_type.value} 이동 실패")
+            return False
+        return True
             
-    def get_all_positions(self) -> Dict[str, Dict[str, Optional[float]]]:
-        return {
-            'antenna_roll': {
-                'position': self.antenna_roll.read_position(),
-                'speed': self.antenna_roll.read_speed()
-            },
-            'antenna_height': {
-                'position': self.antenna_height.read_position(),
-                'speed': self.antenna_height.read_speed()
-            },
-            'eut_roll': {
-                'position': self.eut_roll.read_position(),
-                'speed': None  # EUT_ROLL은 속도 조절 불가
-            },
-            'turntable_roll': {
-                'position': self.turntable_roll.read_position(),
-                'speed': self.turntable_roll.read_speed()
+    def _read_antenna_state(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """공유 포트의 안테나 높이/회전 상태를 한 번의 read_registers로 읽기"""
+        height, roll = self.antenna_height, self.antenna_roll
+        start, count, request = self._antenna_block
+        
+        def execute(instrument):
+            if request is not None:
+                return height._read_registers_raw(instrument, request, count)
+            return instrument.read_registers(start, count, 3)
+        registers = height._execute_modbus_command(execute)
+        if registers is None:
+            return {
+                'antenna_roll': {'position': None, 'speed': None},
+                'antenna_height': {'position': None, 'speed': None}
             }
+        return {
+            'antenna_roll': roll._state_from_registers(registers, start),
+            'antenna_height': height._state_from_registers(registers, start)
         }
 
-    def cleanup(self):
-            """시스템 리소스 정리"""
+    def get_all_positions(self, use_cache: bool = True) -> Dict[str, Dict[str, Optional[float]]]:
+        # TTL 이내에 읽은 축은 캐시 사용 (직전 조회나 백그라운드 폴러 결과를 재사용해 통신 생략)
+        def cached(controller):
+            return controller._cached_state() if use_cache else None
+        eut_state, turntable_state = cached(self.eut_roll), cached(self.turntable_roll)
+        ant_roll_state, ant_height_state = cached(self.antenna_roll), cached(self.antenna_height)
+        
+        # 포트별 동시 요청: 안테나 두 축 1회, EUT/턴테이블 각 1회 (EUT_ROLL은 속도 조절 불가)
+        # 안테나 포트는 호출 스레드에서 직접 읽어 작업자 전달 한 번을 줄임
+        eut = None if eut_state else self._executor.submit(self.eut_roll.read_bulk_state)
+        turntable = None if turntable_state else self._executor.submit(self.turntable_roll.read_bulk_state)
+        if ant_roll_state and ant_height_state:
+            positions = {'antenna_roll': ant_roll_state, 'antenna_height': ant_height_state}
+        else:
+            positions = self._read_antenna_state()
+        positions['eut_roll'] = eut_state or eut.result()
+        positions['turntable_roll'] = turntable_state or turntable.result()
+        return positions
+
+    def start_position_poller(self, hz: float = 20.0, max_age: float = 0.1) -> None:
+        """물리 포트마다 데몬 스레드를 두고 일정 주기로 일괄 읽기하여 위치 캐시를 갱신
+        
+        폴러가 도는 동안 read_position(use_cache=True)는 max_age 이내의 스냅샷을 바로 반환하고,
+        이동 루프처럼 use_cache=False로 읽는 경로만 직접 통신한다.
+        """
+        if self._poller_stop is not None:
+            return
+        interval = 1.0 / hz
+        self._poller_stop = threading.Event()
+        for controller in (self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll):
+            self._poller_saved_ttl[controller] = controller._pos_cache_ttl
+            controller._pos_cache_ttl = max(controller._pos_cache_ttl, max_age)
+        
+        reads = (
+            ('antenna', self._read_antenna_state),
+            ('eut', self.eut_roll.read_bulk_state),
+            ('turntable', self.turntable_roll.read_bulk_state)
+        )
+        for name, read in reads:
+            thread = threading.Thread(
+                target=self._poll_port, args=(read, interval, self._poller_stop),
+                name=f"position-poller-{name}", daemon=True
+            )
+            thread.start()
+            self._poller_threads.append(thread)
+
+    def stop_position_poller(self) -> None:
+        """백그라운드 위치 폴러 종료 및 캐시 TTL 복원"""
+        if self._poller_stop is None:
+            return
+        self._poller_stop.set()
+        for thread in self._poller_threads:
+            thread.join()
+        for controller, ttl in self._poller_saved_ttl.items():
+            controller._pos_cache_ttl = ttl
+        self._poller_stop = None
+        self._poller_threads = []
+        self._poller_saved_ttl = {}
+
+    @staticmethod
+    def _poll_port(read: Callable, interval: float, stop: threading.Event) -> None:
+        """고정 주기로 read() 호출 (read_bulk_state 계열이 각 컨트롤러의 위치 캐시를 갱신)"""
+        next_time = time.monotonic()
+        while not stop.is_set():
             try:
-                # 1. 모든 동작 정지 (각각 독립적으로 시도)
-                for positioner in [self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll]:
-                    try:
-                        positioner.stop_movement()
-                    except Exception as e:
-                        logging.warning(f"{positioner.positioner_type.value} 정지 중 오류: {e}")
-                
-                time.sleep(0.5)  # 충분한 대기 시간
-                
-                # 2. 시작 비트 초기화 시도 (각각 독립적으로)
-                for positioner in [self.antenna_roll, self.antenna_height, self.eut_roll, self.turntable_roll]:
-                    try:
-                        def reset_start_bit(instrument):
-                            instrument.write_bit(positioner.reg_map['START_BIT'], 0, 5)
-                            return True
-                        positioner._execute_modbus_command(reset_start_bit)
-                    except Exception as e:
-                        logging.warning(f"{positioner.positioner_type.value} START 비트 초기화 중 오류: {e}")
-                
-                # 3. 공유 포트 컨트롤러 종료
-                if hasattr(self, 'antenna_port_controller') and self.antenna_port_controller is not None:
-                    try:
-                        self.antenna_port_controller.close_connection()
-                    except Exception as e:
-                        logging.warning(f"안테나 포트 컨트롤러 종료 중 오류: {e}")
-                
-                # 4. 개별 포트 컨트롤러 종료
-                for positioner in [self.eut_roll, self.turntable_roll]:
-                    if not positioner.shared_port and positioner.instrument is not None:
-                        try:
-                            positioner.instrument.serial.reset_input_buffer()
-                            positioner.instrument.serial.reset_output_buffer()
-                            positioner.instrument.serial.close()
-                        except Exception as e:
-                            logging.warning(f"{positioner.positioner_type.value} 포트 종료 중 오류: {e}")
-                            
+                read()
+            except Exception as e:
+                if _log_limiter.allow(('poller', read)):
+                    logging.warning("위치 폴링 중 오류: %s", e)
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay < 0:  # 통신이 주기보다 길면 밀린 주기를 건너뜀
+                next_time = time.monotonic()
+                delay = 0
+            stop.wait(delay)
+
+    def _port_groups(self):
+        """물리 포트별 포지셔너 묶음 (안테나 공유 포트, EUT, 턴테이블)"""
+        return (
+            (self.antenna_roll, self.antenna_height),
+            (self.eut_roll,),
+            (self.turntable_roll,)
+        )
+
+    def _for_each_port(self, action: Callable, label: str, executor: Optional[ThreadPoolExecutor] = None,
+                       timeout: Optional[float] = None) -> None:
+        """포트 묶음마다 action(positioner)을 작업자에서 동시에 실행 (같은 포트 안에서는 순서대로, 각각 독립적으로 시도)"""
+        executor = executor or self._executor
+        futures = [executor.submit(self._run_group, action, label, group) for group in self._port_groups()]
+        _, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            logging.error(f"{label}: {len(not_done)}개 포트가 {timeout}초 안에 응답하지 않음")
+
+    @staticmethod
+    def _run_group(action: Callable, label: str, group) -> None:
+        """한 포트의 포지셔너에 action을 순서대로 실행 (하나가 실패해도 나머지는 시도)"""
+        for positioner in group:
+            try:
+                action(positioner)
             except Exception as e:
-                logging.error(f"Cleanup 중 오류 발생: {e}")
-                # 심각한 오류 발생 시 강제 종료 시도
+                logging.warning(f"{positioner.positioner_type.value} {label} 중 오류: {e}")
+
+    @staticmethod
+    def _reset_start_bit(positioner: PositionerController) -> None:
+        def execute(instrument):
+            positioner._clear_start_bit(instrument)
+            return True
+        positioner._execute_modbus_command(execute)
+
+    def cleanup(self):
+        """시스템 리소스 정리 (여러 번 호출해도 한 번만 수행)"""
+        if self._cleaned:
+            return
+        self._cleaned = True
+        try:
+            # 0. 백그라운드 폴러 종료
+            self.stop_position_poller()
+            
+            # 1. 모든 동작 정지 (포트별 동시 실행)
+            self._for_each_port(PositionerController.stop_movement, "정지")
+            
+            time.sleep(0.05)  # 정지 후 짧은 안정화 대기
+            
+            # 2. 시작 비트 초기화 (포트별 동시 실행)
+            self._for_each_port(self._reset_start_bit, "START 비트 초기화")
+            
+            # 3. 작업자 스레드 종료 (포트를 닫기 전에 진행 중인 작업 마무리)
+            self._executor.shutdown(wait=True)
+            self._stop_executor.shutdown(wait=True)
+            
+            # 4. 포트 컨트롤러 종료 (안테나 공유 포트, EUT/턴테이블 개별 포트)
+            for port_controller in (self.antenna_port_controller,
+                                    self.eut_roll.port_controller,
+                                    self.turntable_roll.port_controller):
+                try:
+                    port_controller.close_connection()
+                except Exception as e:
+                    logging.warning(f"포트 {port_controller.port} 종료 중 오류: {e}")
+                        
+        except Exception as e:
+            logging.error(f"Cleanup 중 오류 발생: {e}")
+            # 심각한 오류 발생 시 강제 종료 시도
+            self._executor.shutdown(wait=False)
+            self._stop_executor.shutdown(wait=False)
+            for serial_port in self._open_serials:
                 try:
-                    if hasattr(self, 'antenna_port_controller'):
-                        if hasattr(self.antenna_port_controller, 'instrument'):
-                            if hasattr(self.antenna_port_controller.instrument, 'serial'):
-                                self.antenna_port_controller.instrument.serial.close()
-                except:
+                    serial_port.close()
+                except Exception:
                     pass
 
     def emergency_stop_all(self) -> None:
-        self.antenna_roll.stop_movement()
-        self.antenna_height.stop_movement()
-        self.eut_roll.stop_movement()
-        self.turntable_roll.stop_movement()
+        """모든 축 정지. 다음 move_to_measurement_position/move_sweep 호출 전까지 이동 루프의 START 재전송을 막음"""
+        # 정지 명령보다 먼저 중단 신호 설정 (진행 중인 이동 루프가 정지 직후 START를 다시 보내지 않도록)
+        self._abort.set()
+        if self._cleaned:
+            # cleanup 이후에는 작업자가 종료되어 새 작업을 받을 수 없으므로 호출 스레드에서 순서대로 정지
+            for group in self._port_groups():
+                self._run_group(PositionerController.stop_movement, "비상 정지", group)
+            return
+        # 이동 작업이 _executor를 점유하고 있어도 바로 실행되도록 정지 전용 작업자 사용 (포트당 1개)
+        self._for_each_port(PositionerController.stop_movement, "비상 정지", self._stop_executor, timeout=2.0)
 
     def set_all_speeds(self, speed: int) -> bool:
-        success = True
-        success &= self.antenna_roll.set_speed(speed)
-        success &= self.antenna_height.set_speed(speed)
-        success &= self.eut_roll.set_speed(speed)
-        success &= self.turntable_roll.set_speed(speed)
-        return success
+        # 포트별 작업자에서 동시에 설정 (같은 포트 안에서는 순서대로, 모든 축에 시도한 뒤 결과 취합)
+        def set_group(group):
+            return [bool(positioner.set_speed(speed)) for positioner in group]
+        futures = [self._executor.submit(set_group, group) for group in self._port_groups()]
+        return all([success for future in futures for success in future.result()])
 
 # 사용 예시
 if __name__ == "__main__":
@@ -788,7 +1438,6 @@ if __name__ == "__main__":
         
     try:
         # 초기 위치 확인
-        positions = system.get_all_positions()
         print("\n현재 각 포지셔너의 위치와 속도:")
         positions = system.get_all_positions()
         print(f"안테나 높이: {positions['antenna_height']['position']:.2f} mm (속도: {positions['antenna_height']['speed']})")
@@ -1,8 +1,50 @@
 # simple_modbus_cli.py
+import ast
+import re
 import minimalmodbus
 import serial
 import sys
 
+# 명령 형식: 함수명(인자, ...)
+COMMAND_PATTERN = re.compile(r'(\w+)\s*\((.*)\)\s*$')
+
+
+def parse_args(arg_str):
+    """
+    괄호 안의 인자 문자열을 파이썬 값 튜플로 변환합니다.
+    파이썬 리터럴(0x10, 리스트, 따옴표 문자열 등)은 ast.literal_eval로 한 번에 변환하고,
+    리터럴이 아닌 입력(true/false 소문자, 따옴표 없는 문자열)은 인자별로 변환합니다.
+    """
+    if arg_str.strip() == "":
+        return ()
+    try:
+        # 끝에 쉼표를 붙여 인자가 하나여도 항상 튜플이 되도록 함
+        return ast.literal_eval(f"({arg_str},)")
+    except (ValueError, SyntaxError):
+        pass
+
+    return tuple(_coerce(item) for item in arg_str.split(","))
+
+
+def _coerce(token):
+    """인자 하나를 bool -> int(0x/0o/0b 포함) -> float 순으로 변환, 모두 실패하면 문자열 그대로"""
+    token = token.strip()
+    lowered = token.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    for base in (0, 10):  # 0: 접두사로 진법 판단, 10: '010'처럼 0으로 시작하는 10진수
+        try:
+            return int(token, base)
+        except ValueError:
+            pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
 def main():
     # -----------------------------------------
     # 1. MinimalModbus 설정
@@ -43,35 +85,14 @@ def main():
         # -----------------------------------------
         # 예: read_bit(2,2) -> 함수명: read_bit, 인자: [2, 2]
         #     write_long(10, 12345, 3, False) -> 함수명: write_long, 인자: [10, 12345, 3, False]
-        # 문자열 형태에서 ( ) 안의 인자를 추출하고, 쉼표로 구분해 처리.
+        # 문자열 형태에서 ( ) 안의 인자를 추출하고, parse_args로 파이썬 값으로 변환.
         try:
-            func_name, arg_str = command_str.split("(", 1)
-            func_name = func_name.strip()
-            arg_str = arg_str.strip(")")
-            if arg_str.strip() == "":
-                args = []
-            else:
-                # 쉼표로 분할
-                raw_args = [x.strip() for x in arg_str.split(",")]
-                # 각 인자를 숫자나 bool, str 등으로 변환
-                args = []
-                for item in raw_args:
-                    # True/False 변환
-                    if item.lower() == 'true':
-                        args.append(True)
-                    elif item.lower() == 'false':
-                        args.append(False)
-                    # 정수 변환
-                    elif item.isdigit() or (item.startswith('-') and item[1:].isdigit()):
-                        args.append(int(item))
-                    else:
-                        # 소수점 포함 여부
-                        try:
-                            float_val = float(item)
-                            args.append(float_val)
-                        except ValueError:
-                            # 문자열 그대로
-                            args.append(item)
+            match = COMMAND_PATTERN.match(command_str)
+            if match is None:
+                print(f"명령 형식이 올바르지 않습니다: {command_str}")
+                continue
+            func_name = match.group(1)
+            args = parse_args(match.group(2))
             
             # -----------------------------------------
             # 4. 함수 호출 로직
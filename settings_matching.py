@@ -0,0 +1,128 @@
+# settings_matching.py
+# 테스트 파라미터와 Frequency Table / Analyzer Settings 시트 행을 매칭하는 순수 pandas 로직
+# (GUI·VISA 의존성 없이 import 가능하도록 test_utils에서 분리, test_utils에서 그대로 다시 export)
+import weakref
+import numpy as np
+import pandas as pd
+from logger_config import get_logger
+
+logger = get_logger()
+
+
+def is_valid_match(test_params, row, keys):
+    return all(test_params[key] == row[key] for key in keys)
+
+# 주파수 테이블 DataFrame별 (Band, Technology, Bandwidth, Channel) -> Center Frequency 사전
+# id(DataFrame) -> (weakref, 사전): 같은 테이블로 여러 테스트를 조회할 때 한 번만 생성
+# DataFrame이 해제되면 weakref.finalize로 항목도 제거됨 (제자리 수정은 반영되지 않음)
+_frequency_map_cache = {}
+
+
+def _frequency_map(frequency_table_df):
+    key = id(frequency_table_df)
+    cached = _frequency_map_cache.get(key)
+    if cached is not None and cached[0]() is frequency_table_df:
+        return cached[1]
+
+    # ';'로 나열된 Band를 행 단위로 펼친 뒤 키 튜플로 색인
+    long_df = frequency_table_df.assign(
+        Band=frequency_table_df['Band'].astype(str).str.split(';')
+    ).explode('Band')
+    keys = zip(long_df['Band'], long_df['Technology'], long_df['Bandwidth'], long_df['Channel'])
+    freq_map = {}
+    for freq_key, center_frequency in zip(keys, long_df['Center Frequency']):
+        freq_map.setdefault(freq_key, center_frequency)  # 같은 키가 여러 행이면 첫 행 사용
+
+    _frequency_map_cache[key] = (weakref.ref(frequency_table_df), freq_map)
+    weakref.finalize(frequency_table_df, _frequency_map_cache.pop, key, None)
+    return freq_map
+
+
+def match_frequency_table_center_frequency(test_params, frequency_table_df):
+    try:
+        freq_map = _frequency_map(frequency_table_df)
+        return freq_map.get((test_params['Band'], test_params['Technology'],
+                             test_params['Bandwidth'], test_params['Channel']))
+    except Exception as e:
+        logger.error(f"Error in matching frequency table: {e}")
+        return None
+
+
+# ';'로 여러 값을 나열할 수 있는 컬럼과, 값이 비어 있으면 비교하지 않는 컬럼
+MULTI_VALUED_KEYS = ('Channel', 'Band', 'Technology', 'Number of Carriers')
+OPTIONAL_KEYS = ('Channel', 'Number of Resource Blocks')
+
+
+def _multi_value_mask(cells, param_value_str):
+    """cells(문자열 Series)를 ';'로 나눈 값 중에 param_value_str이 있는 행 (pandas 문자열 연산으로 한 번에 계산)"""
+    if ';' in param_value_str:
+        return pd.Series(False, index=cells.index)
+    return (';' + cells + ';').str.contains(f';{param_value_str};', regex=False)
+
+
+# Analyzer Settings DataFrame별 문자열 변환 컬럼 캐시
+# id(DataFrame) -> (weakref, {컬럼: (문자열 Series, 빈 값 mask)}): 매칭마다 astype(str)를 반복하지 않도록 보관
+# DataFrame이 해제되면 weakref.finalize로 항목도 제거됨.
+# 캐시한 뒤 DataFrame을 제자리에서 수정하면 반영되지 않으므로, 수정했다면 새 DataFrame(copy)을 전달할 것.
+_string_columns_cache = {}
+
+
+def _string_column(df, column):
+    """df[column]을 문자열로 변환한 Series와 빈 값 mask (DataFrame·컬럼별로 한 번만 변환)"""
+    key = id(df)
+    cached = _string_columns_cache.get(key)
+    if cached is None or cached[0]() is not df:
+        cached = (weakref.ref(df), {})
+        _string_columns_cache[key] = cached
+        weakref.finalize(df, _string_columns_cache.pop, key, None)
+    columns = cached[1]
+    if column not in columns:
+        columns[column] = (df[column].astype(str), df[column].isna().to_numpy())
+    return columns[column]
+
+
+def match_analyzer_settings(test_params, analyzer_settings_df, param_mapping):
+    """
+    test_params와 모든 키가 일치하는 첫 번째 Analyzer Settings 행의 설정(6번째 컬럼부터)을 반환합니다.
+    행마다 iterrows로 비교하지 않고 키별 boolean mask를 만들어 AND로 합칩니다.
+    """
+    mask = np.ones(len(analyzer_settings_df), dtype=bool)
+
+    for key, value in param_mapping.items():
+        param_value = test_params.get(key)
+        if key in MULTI_VALUED_KEYS:
+            # Channel 값이 숫자인 경우 정수로 변환하여 문자열로 처리
+            if key == 'Channel' and isinstance(param_value, (int, float)):
+                param_value_str = str(int(param_value))
+            else:
+                param_value_str = str(param_value)
+
+        if value not in analyzer_settings_df.columns:
+            if key in OPTIONAL_KEYS:
+                continue  # 컬럼이 없으면 빈 값과 같으므로 비교하지 않음
+            # 컬럼이 없으면 빈 값과 비교 (여러 값 컬럼은 '', 단일 값 컬럼은 None)
+            missing = '' if key in MULTI_VALUED_KEYS else 'None'
+            if (param_value_str if key in MULTI_VALUED_KEYS else str(param_value)) != missing:
+                mask[:] = False
+            continue
+
+        cells, empty = _string_column(analyzer_settings_df, value)
+        if key in MULTI_VALUED_KEYS:
+            key_mask = _multi_value_mask(cells, param_value_str).to_numpy()
+        else:
+            key_mask = cells.to_numpy() == str(param_value)
+
+        if key in OPTIONAL_KEYS:
+            key_mask = key_mask | empty  # Channel 정보가 없는 경우 비교하지 않음
+
+        mask &= key_mask
+        if not mask.any():
+            logger.info(f"Matching failed at key '{key}', Test Param: '{param_value}'")
+            return None
+
+    if not mask.any():
+        return None
+    position = int(mask.argmax())
+    row = analyzer_settings_df.iloc[position]
+    logger.info(f"Matching successful for row index {analyzer_settings_df.index[position]}: {row.to_dict()}")
+    return {col: row[col] for col in analyzer_settings_df.columns[5:]}
@@ -1,6 +1,11 @@
 import time
 import logging
-from modbus_control import PositionerType, PositionerController
+from modbus_control import PositionerType, PositionerController, TOLERANCE
+
+# 위치 폴링 간격: 목표 근처에서는 짧게, 멀리 있을 때는 두 배씩 늘려 최대값까지
+MIN_POLL_S = 0.05
+MAX_POLL_S = 0.5
+NEAR_TARGET_DEG = 5.0  # 이 범위 안에서는 최소 간격으로 폴링
 
 # 로깅 설정
 logging.basicConfig(
@@ -35,25 +40,33 @@ def test_antenna_roll(port='COM15', target_position=90.0):
         # 이동하는 동안 현재 위치 모니터링
         print("\n현재 위치 모니터링 중...")
         start_time = time.time()
+        poll_interval = MIN_POLL_S
         while True:
+            # 한 번 읽은 위치로 출력과 완료 판단을 함께 처리 (is_movement_complete의 중복 읽기 생략)
             current_pos = ant_roll.read_position()
-            print(f"현재 위치: {current_pos:.2f}°")
-            
-            # 이동 완료 확인
-            if ant_roll.is_movement_complete(target_position):
-                print("\n이동 완료!")
-                break
+            near_target = False
+            if current_pos is not None:
+                print(f"현재 위치: {current_pos:.2f}°")
+                remaining = abs(current_pos - target_position)
+                
+                # 이동 완료 확인
+                if remaining < TOLERANCE:
+                    print("\n이동 완료!")
+                    break
+                near_target = remaining < NEAR_TARGET_DEG
                 
             # 30초 타임아웃
             if time.time() - start_time > 30:
                 print("\n타임아웃: 30초 초과")
                 break
                 
-            time.sleep(0.5)  # 0.5초마다 위치 확인
+            time.sleep(poll_interval)
+            poll_interval = MIN_POLL_S if near_target else min(poll_interval * 2, MAX_POLL_S)
 
-        # 최종 위치 확인
-        final_pos = ant_roll.read_position()
-        print(f"\n최종 위치: {final_pos:.2f}°")
+        # 최종 위치 확인 (완료 시에는 마지막으로 읽은 값이 최종 위치)
+        final_pos = current_pos if current_pos is not None else ant_roll.read_position()
+        if final_pos is not None:
+            print(f"\n최종 위치: {final_pos:.2f}°")
 
         return True
 
@@ -1,21 +1,40 @@
 # test_utils.py
 import os
 import time
-import re
+import atexit
+from contextlib import contextmanager
 import pyvisa
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog
 import openpyxl
-from openpyxl.utils import get_column_letter
 from PySide6.QtWidgets import QFileDialog
 from logger_config import get_logger  
+# 시트 매칭 함수는 GUI 의존성이 없는 모듈에 있고, 기존 호출 측을 위해 여기서 다시 export
+from settings_matching import (  # noqa: F401
+    MULTI_VALUED_KEYS, OPTIONAL_KEYS, is_valid_match,
+    match_frequency_table_center_frequency, match_analyzer_settings
+)
 
 logger = get_logger()
 
+SCREENSHOT_CHUNK_SIZE = 1024 * 1024  # 스크린샷 전송 시 VISA 읽기 블록 크기 (bytes)
+
+
+@contextmanager
+def _open_workbook(file_path):
+    """workbook을 열어 작업 후 저장하고 닫습니다."""
+    workbook = openpyxl.load_workbook(file_path)
+    try:
+        yield workbook
+        workbook.save(file_path)
+    finally:
+        workbook.close()
+
 
 def is_excel_file(file_path):
-    return re.search(r'\.xlsx$', file_path, re.IGNORECASE) is not None
+    return file_path.lower().endswith('.xlsx')
 
 
 
@@ -41,12 +60,26 @@ def read_excel_sheet(file_path, sheet_name):
         print(f"Error reading sheet {sheet_name}: {e}")
         return None
 
+def read_column_cells(file_path, sheet_name, column, min_row, max_row):
+    """
+    시트의 한 컬럼에서 min_row~max_row 셀 값만 읽습니다 (1부터 시작).
+    몇 개 셀만 필요할 때 pandas로 시트 전체를 읽지 않도록 openpyxl read_only 모드를 사용합니다.
+    """
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(min_row=min_row, max_row=max_row,
+                                              min_col=column, max_col=column, values_only=True)
+        values = [row[0] for row in rows]
+    finally:
+        workbook.close()
+    # 시트가 짧으면 빈 셀(None)로 채움
+    return values + [None] * (max_row - min_row + 1 - len(values))
+
 def read_gpib_addresses(file_path):
     try:
         # Assuming 'Chamber Config' sheet has consistent format with GPIB addresses at specific locations
-        config_df = pd.read_excel(file_path, sheet_name='Chamber Config', usecols="B", header=None, nrows=3)
-        analyzer_gpib = config_df.iloc[1, 0]  # Read only the required cell directly
-        bt_tester_gpib = config_df.iloc[2, 0]
+        # B2: Analyzer, B3: BT Tester (필요한 셀만 직접 읽기)
+        analyzer_gpib, bt_tester_gpib = read_column_cells(file_path, 'Chamber Config', 2, 2, 3)
 
         # Optional: Validate GPIB addresses to ensure they are integers
         analyzer_gpib = str(analyzer_gpib)
@@ -64,78 +97,62 @@ def read_gpib_addresses(file_path):
         return {}
 
 
-def is_valid_match(test_params, row, keys):
-    return all(test_params[key] == row[key] for key in keys)
-
-def match_frequency_table_center_frequency(test_params, frequency_table_df):
-    try:
-        for index, row in frequency_table_df.iterrows():
-            bands = str(row['Band']).split(';')
-            if test_params['Band'] not in bands:
-                continue
-            if is_valid_match(test_params, row, ['Technology', 'Bandwidth', 'Channel']):
-                return row['Center Frequency']
-        return None
-    except Exception as e:
-        logger.error(f"Error in matching frequency table: {e}")
-        return None
-
-
-
-def match_analyzer_settings(test_params, analyzer_settings_df, param_mapping):
-    for index, row in analyzer_settings_df.iterrows():
-        match_found = True
-
-        for key, value in param_mapping.items():
-            if key in ['Channel', 'Number of Resource Blocks'] and pd.isna(row.get(value)):
-                continue  # Channel 정보가 없는 경우 비교하지 않음
-
-            if key in ['Channel', 'Band', 'Technology','Number of Carriers']:
-                setting_values = str(row.get(value, '')).split(';')
-                param_value = test_params.get(key)
-
-                # Channel 값이 숫자인 경우 정수로 변환하여 문자열로 처리
-                if key == 'Channel':
-                    if isinstance(param_value, (int, float)):
-                        param_value_str = str(int(param_value))
-                    else:
-                        param_value_str = str(param_value)
-                else:
-                    param_value_str = str(param_value)
-
-                if param_value_str not in setting_values:
-                    match_found = False
-                    logger.info(f"Matching failed for key '{key}', Test Param: '{param_value_str}', Row Values: {setting_values}")
-                    break
-            else:
-                if str(test_params.get(key)) != str(row.get(value)):
-                    match_found = False
-                    logger.info(f"Matching failed for key '{key}', Test Param: '{test_params.get(key)}', Row Value: '{row.get(value)}'")
-                    break
-
-        if match_found:
-            logger.info(f"Matching successful for row index {index}: {row.to_dict()}")
-            return {col: row[col] for col in analyzer_settings_df.columns[5:]}
-        # else:
-        #     logger.info(f"No match found for test parameters: {test_params}")
-
-    return None
-
 def save_updated_test_plan(file_path, test_plan_df, sheet_name, column_to_update):
     try:
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook[sheet_name]
+        with _open_workbook(file_path) as workbook:
+            sheet = workbook[sheet_name]
 
-        # 업데이트할 컬럼이 첫 번째라고 가정
-        for index, row in test_plan_df.iterrows():
-            if str(row.iloc[0]).startswith('#'):
+            # 업데이트할 컬럼이 첫 번째라고 가정: '#'으로 시작하는 행만 미리 골라 기록
+            first_column = test_plan_df.iloc[:, 0]
+            modified = first_column[first_column.astype(str).str.startswith('#')]
+            for index, value in modified.items():
                 # OpenPyXL은 1부터 인덱싱, 행과 열 인덱스에 1을 더함
-                sheet.cell(row=index + 2, column=column_to_update).value = row.iloc[0]
-
-        workbook.save(file_path)
+                sheet.cell(row=index + 2, column=column_to_update).value = value
     except Exception as e:
         logger.error(f"테스트 플랜 업데이트 중 오류 발생: {e}")
 
+# VISA ResourceManager: 생성 시 백엔드 초기화/리소스 탐색 비용이 크므로 프로세스 전체에서 하나만 사용
+# (instrument_control도 이 함수를 가져다 씀)
+_resource_manager = None
+
+def get_resource_manager():
+    global _resource_manager
+    if _resource_manager is None:
+        _resource_manager = pyvisa.ResourceManager()
+    return _resource_manager
+
+# 스크린샷용 분석기 VISA 세션: 캡처마다 TCPIP 연결을 반복하지 않도록 주소별로 재사용
+_analyzer_sessions = {}
+
+def _get_analyzer_session(address):
+    """주소별로 캐시한 세션을 반환하고, 없거나 닫혀 있으면 새로 엽니다."""
+    device = _analyzer_sessions.get(address)
+    if device is not None:
+        try:
+            device.session  # 닫힌 세션이면 InvalidSession 발생
+            return device
+        except pyvisa.errors.InvalidSession:
+            del _analyzer_sessions[address]
+
+    device = open_instrument(address, get_resource_manager())
+    if device is not None:
+        _analyzer_sessions[address] = device
+    return device
+
+def _discard_analyzer_session(address):
+    """통신 오류가 난 세션은 닫고 캐시에서 제거 (다음 호출에서 다시 연결)"""
+    device = _analyzer_sessions.pop(address, None)
+    if device is not None:
+        try:
+            device.close()
+        except Exception:
+            pass
+
+@atexit.register
+def close_analyzer_sessions():
+    for address in list(_analyzer_sessions):
+        _discard_analyzer_session(address)
+
 def open_instrument(address, resource_manager):
     try:
         instrument = resource_manager.open_resource(address)
@@ -150,17 +167,13 @@ def read_save_data(file_path):
     """
     Excel 파일의 'Save Data' 시트에서 데이터를 읽습니다.
     """
-    save_data_df = read_excel_sheet(file_path, 'Save Data')
-    if save_data_df is None:
-        logger.error("Error: 'Save Data' 시트를 로드할 수 없습니다.")
+    try:
+        # 첫 행은 헤더, B2~B5에 필요한 정보가 있음 (시트 전체를 읽지 않고 해당 셀만 읽기)
+        model_number, sample_no, user_id, base_folder_path = read_column_cells(file_path, 'Save Data', 2, 2, 5)
+    except Exception as e:
+        logger.error(f"Error: 'Save Data' 시트를 로드할 수 없습니다. {e}")
         return None
 
-    # 필요한 정보 추출
-    model_number = save_data_df.iloc[0, 1]
-    sample_no = save_data_df.iloc[1, 1]
-    user_id = save_data_df.iloc[2, 1]
-    base_folder_path = save_data_df.iloc[3, 1] # 데이터 저장을 위한 기본 폴더 경로
-
     return {
         'Model Number': model_number,
         'Sample No': sample_no,
@@ -168,112 +181,105 @@ def read_save_data(file_path):
         'Base Folder Path': base_folder_path
     }     
 
-def generate_file_name(test_params, additional_suffix=''):
-    file_name_parts = [
-        str(test_params.get('Test', '')),
-        str(test_params.get('Band', '')),
-        str(test_params.get('Antenna', '')),
-        str(test_params.get('Mode', '')),
-        str(test_params.get('Number of Carriers', '')),
-        str(test_params.get('Modulation', '')),
-        str(test_params.get('Bandwidth', '')),
-        str(test_params.get('Channel', '')) + additional_suffix,
-        str(test_params.get('Beam ID', '')),
-        str(test_params.get('Resource Block Start', '')),
-        str(test_params.get('Number of Resource Blocks', ''))
-    ]
+# 파일 이름에 들어가는 test_params 키 (순서대로 '_'로 연결)
+FILE_NAME_KEYS = (
+    'Test', 'Band', 'Antenna', 'Mode', 'Number of Carriers', 'Modulation',
+    'Bandwidth', 'Channel', 'Beam ID', 'Resource Block Start', 'Number of Resource Blocks'
+)
 
-    file_name_parts = [part if part != 'nan' else '' for part in file_name_parts]
+def generate_file_name(test_params, additional_suffix=''):
+    def parts():
+        for key in FILE_NAME_KEYS:
+            part = str(test_params.get(key, ''))
+            if key == 'Channel':
+                part += additional_suffix
+            if part and part != 'nan':  # 빈 값/NaN은 건너뜀
+                yield part
 
-    return '_'.join(filter(None, file_name_parts))
+    return '_'.join(parts())
 
 
 
 def update_data_in_excel(file_path, sheet_name, match_columns, test_params, result1, result2=None):
-    workbook = openpyxl.load_workbook(file_path)
-    sheet = workbook[sheet_name]
+    with _open_workbook(file_path) as workbook:
+        return _update_data_in_sheet(workbook[sheet_name], match_columns, test_params, result1, result2)
+
+
+def _read_match_frame(sheet, match_columns):
+    """헤더와, 2행부터 매칭 컬럼 값만 담은 DataFrame을 읽습니다 (DataFrame 행 i = 시트 행 i + 2)."""
     header = [cell.value for cell in sheet[1]]  # 헤더 행 읽기
+    columns = [col for col in match_columns if col in header]
+    indices = [header.index(col) for col in columns]
+    data = [[row[idx] if idx < len(row) else None for idx in indices]
+            for row in sheet.iter_rows(min_row=2, values_only=True)]
+    return header, pd.DataFrame(data, columns=columns, dtype=object)
+
+
+def _update_data_in_sheet(sheet, match_columns, test_params, result1, result2):
+    header, match_frame = _read_match_frame(sheet, match_columns)
 
     # 결과 컬럼 이름 설정
     result_column1 = 'On Time' if test_params['Test'] == 'Duty' else 'Result1'
     result_column2 = 'Period' if test_params['Test'] == 'Duty' else ('Result2(optional)' if result2 is not None else None)
 
-    # 매칭 컬럼의 인덱스 찾기
-    match_indices = [header.index(col) for col in match_columns if col in header]
     result_index1 = header.index(result_column1) if result_column1 in header else None
     result_index2 = header.index(result_column2) if result_column2 and result_column2 in header else None
 
-    update_successful = False  # Flag to track success
+    # 컬럼별 boolean mask를 AND로 합쳐 첫 번째 일치 행 찾기 (값이 NaN이면 빈 셀과 일치)
+    mask = np.ones(len(match_frame), dtype=bool)
+    for col in match_frame.columns:
+        value = test_params[col]
+        cells = match_frame[col]
+        mask &= (cells.isna() if pd.isna(value) else cells == value).to_numpy()
 
-    for row in sheet.iter_rows(min_row=2):
-        row_values = [cell.value for cell in row]
-        # logger.info(f"Checking row: {row_values}")
+    if not mask.any():
+        return False
 
-        if all(pd.isna(row[idx].value) if pd.isna(test_params[col]) else row[idx].value == test_params[col] 
-               for idx, col in zip(match_indices, match_columns)):
-            logger.info(f"Match found: {row_values}")
-            if result_index1 is not None and result1 is not None:
-                row[result_index1].value = result1
-                logger.info(f"Updated Result1: {result1}")
+    row_number = int(mask.argmax()) + 2  # OpenPyXL은 1부터, 1행은 헤더
+    logger.info(f"Match found at row {row_number}: {match_frame.iloc[row_number - 2].to_dict()}")
+    if result_index1 is not None and result1 is not None:
+        sheet.cell(row=row_number, column=result_index1 + 1).value = result1
+        logger.info(f"Updated Result1: {result1}")
 
-            if result_index2 is not None and result2 is not None:
-                row[result_index2].value = result2
-                logger.info(f"Updated Result2: {result2}")
+    if result_index2 is not None and result2 is not None:
+        sheet.cell(row=row_number, column=result_index2 + 1).value = result2
+        logger.info(f"Updated Result2: {result2}")
 
-            update_successful = True  # Update successful flag set
-            break
-        else:
-            # 실패한 매칭에 대한 정보 로그에 기록
-            failed_matches = [(col, test_params[col], row[idx].value) for idx, col in zip(match_indices, match_columns) if not (pd.isna(row[idx].value) if pd.isna(test_params[col]) else row[idx].value == test_params[col])]
-            # logger.info(f"Match failed for row: {row_values}. Failed matches: {failed_matches}")
-
-    workbook.save(file_path)
-    workbook.close()
-    return update_successful
+    return True
 
 def record_notification(file_path, notification_type, message):
-    workbook = openpyxl.load_workbook(file_path)
-    sheet_name = 'Notification'
+    with _open_workbook(file_path) as workbook:
+        sheet_name = 'Notification'
     
-    if sheet_name not in workbook.sheetnames:
-        workbook.create_sheet(sheet_name)
-    sheet = workbook[sheet_name]
+        if sheet_name not in workbook.sheetnames:
+            workbook.create_sheet(sheet_name)
+        sheet = workbook[sheet_name]
 
-    # Find the first empty row in the sheet
-    max_row = sheet.max_row + 1 if sheet.max_row > 1 else 1
+        # Find the first empty row in the sheet
+        max_row = sheet.max_row + 1 if sheet.max_row > 1 else 1
     
-    # Insert the notification
-    sheet[f"A{max_row}"] = notification_type
-    sheet[f"B{max_row}"] = message
+        # Insert the notification
+        sheet[f"A{max_row}"] = notification_type
+        sheet[f"B{max_row}"] = message
 
-    # Auto-adjust column widths
-    for col in sheet.columns:
-        max_length = 0
-        column = col[0].column
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        sheet.column_dimensions[get_column_letter(column)].width = adjusted_width
-
-
-    workbook.save(file_path)
-    workbook.close()
+        # 새로 쓴 두 셀 기준으로만 컬럼 너비 확장 (기존 셀은 이전 호출에서 이미 반영됨, 추가마다 O(1))
+        # 너비가 저장되지 않은 컬럼은 openpyxl 기본값(13) 대신 0에서 시작
+        for column, value in (('A', notification_type), ('B', message)):
+            current = sheet.column_dimensions[column].width if column in sheet.column_dimensions else 0
+            sheet.column_dimensions[column].width = max(current or 0, len(str(value)) + 2)
 
 
 def capture_and_save_screen(test_params, save_data, file_path, additional_suffix=''):
-    rm = pyvisa.ResourceManager()
-    device = None
+    address = None
+    local_path = None
     try:
         # Chamber Config 시트에서 GPIB 주소 읽기
         gpib_addresses = read_gpib_addresses(file_path)
         analyzer_gpib = gpib_addresses.get('Analyzer GPIB', '18')  # 기본값 '18'
 
-        # GPIB 주소를 사용하여 장비에 연결
-        device = open_instrument(f'TCPIP0::{analyzer_gpib}::inst0::INSTR', rm)
+        # GPIB 주소를 사용하여 장비에 연결 (이전 캡처에서 연 세션 재사용)
+        address = f'TCPIP0::{analyzer_gpib}::inst0::INSTR'
+        device = _get_analyzer_session(address)
         
         if device is None:
             logger.error("Failed to connect to the instrument.")
@@ -316,14 +322,16 @@ def capture_and_save_screen(test_params, save_data, file_path, additional_suffix
         device.write('HCOP:IMM')
 
         # Retrieve the screenshot
+        # bytearray 컨테이너로 받아 int 리스트 생성/재복사 없이 그대로 기록, 큰 블록 단위로 읽기
+        device.chunk_size = SCREENSHOT_CHUNK_SIZE
         query = f'MMEM:DATA? "{device_path}"'
-        file_data = device.query_binary_values(query, datatype='B')
+        file_data = device.query_binary_values(query, datatype='B', container=bytearray)
         with open(local_path, "wb") as file:
-            file.write(bytearray(file_data))
+            file.write(file_data)
         
         logger.info(f"Screenshot saved to {local_path}.")
+    except pyvisa.VisaIOError as e:
+        logger.error(f"Error during screen capture: {e}, at {local_path}")
+        _discard_analyzer_session(address)
     except Exception as e:
         logger.error(f"Error during screen capture: {e}, at {local_path}")
-    finally:
-        if device:
-            device.close()
@@ -0,0 +1,113 @@
+# test_bayesian_optimization.py
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("scipy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bayesian_optimization import BayesianOptimizer  # noqa: E402
+
+
+def _optimizer_with_observations(n=6, seed=0, **kwargs):
+    rng = np.random.default_rng(seed)
+    bo = BayesianOptimizer(n_restarts_optimizer=0, **kwargs)
+    for _ in range(n):
+        x = bo._lo + rng.random(4) * bo._scale
+        bo.add_observation(x, float(np.sin(x[0] / 60.0) + np.cos(x[3] / 40.0)))
+    return bo
+
+
+def test_suggested_point_does_not_alias_candidate_pool():
+    bo = _optimizer_with_observations()
+    pool_before = bo._X_cand.copy()
+
+    best_x, _ = bo.suggest_next_point(n_local_starts=0)
+    best_x[:] = -1.0  # 호출 측에서 반올림/클리핑하는 경우
+
+    best_xs, _ = bo.suggest_next_batch(q=2)
+    best_xs[:] = -1.0
+
+    np.testing.assert_array_equal(bo._X_cand, pool_before)
+
+
+def test_local_ei_gradient_matches_finite_difference():
+    bo = _optimizer_with_observations(n=8)
+    bo.train_gp()
+    y_max, xi = float(np.max(bo.y)), 0.01
+
+    u = np.array([0.3, 0.6, 0.4, 0.7])
+    neg_ei, grad = bo._neg_ei_and_grad(u, y_max, xi)
+
+    x = (bo._lo + u * bo._scale).reshape(1, -1)
+    assert neg_ei == pytest.approx(-bo.expected_improvement(x, xi=xi)[0], rel=1e-6, abs=1e-12)
+
+    h = 1e-6
+    numeric = np.empty(4)
+    for d in range(4):
+        step = np.zeros(4)
+        step[d] = h
+        numeric[d] = (bo._neg_ei_and_grad(u + step, y_max, xi)[0]
+                      - bo._neg_ei_and_grad(u - step, y_max, xi)[0]) / (2 * h)
+    np.testing.assert_allclose(grad, numeric, rtol=1e-4, atol=1e-8)
+
+
+def test_local_refinement_uses_seed_pool_and_stays_in_bounds():
+    bo = _optimizer_with_observations(n=8, local_seed_pool_size=256)
+    best_x, best_ei = bo.suggest_next_point(n_local_starts=4)
+
+    assert len(bo._X_seed) == 256
+    assert np.all(best_x >= bo._lo) and np.all(best_x <= bo._lo + bo._scale)
+    # 국소 최적화 결과는 seed 풀에서 고른 최선값보다 나빠지지 않음
+    assert best_ei >= np.max(bo.expected_improvement(bo._X_seed)) - 1e-12
+
+
+def test_length_scale_is_given_in_parameter_units():
+    bo = BayesianOptimizer(length_scale=50.0)
+    np.testing.assert_allclose(bo._kernel0.k1.length_scale, 50.0 / bo._scale)
+
+    bo = BayesianOptimizer(length_scale=[36.0, 36.0, 2.0, 18.0])
+    np.testing.assert_allclose(bo._kernel0.k1.length_scale, 0.1)
+
+
+def test_observation_buffer_grows_and_keeps_data():
+    bo = BayesianOptimizer(initial_capacity=2)
+    rng = np.random.default_rng(1)
+    xs = bo._lo + rng.random((5, 4)) * bo._scale
+    for i, x in enumerate(xs):
+        bo.add_observation(tuple(x), float(i))
+
+    assert bo._X.shape[0] == 8  # 2 -> 4 -> 8
+    np.testing.assert_array_equal(bo.X, xs)
+    np.testing.assert_array_equal(bo.y, np.arange(5, dtype=float))
+    # 후보-관측 제곱차 캐시도 확장 후 그대로 유지
+    expected = np.square(bo._U_cand[None, :, :] - bo._normalize(xs)[:, None, :]).transpose(2, 1, 0)
+    np.testing.assert_allclose(bo._sq_diff[:, :, :5], expected)
+
+
+def test_cached_pool_prediction_matches_gpr_predict():
+    bo = _optimizer_with_observations(n=10)
+    bo.train_gp()
+    mu, std = bo._predict(bo._X_cand)
+    mu_ref, std_ref = bo.gpr.predict(bo._U_cand, return_std=True)
+    np.testing.assert_allclose(mu, mu_ref, rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(std, std_ref, rtol=1e-5, atol=1e-9)
+
+
+def test_expected_improvement_paths_agree(monkeypatch):
+    import bayesian_optimization
+
+    bo = _optimizer_with_observations(n=10)
+    bo.train_gp()
+    pool_ei = bo.expected_improvement(bo._X_cand)
+    fresh = bo._X_cand.copy()  # 고정 풀이 아닌 배열: gpr.predict 경로
+    fresh_ei = bo.expected_improvement(fresh)
+    np.testing.assert_allclose(pool_ei, fresh_ei, rtol=1e-5, atol=1e-10)
+
+    # numba 유무와 관계없이 같은 결과
+    monkeypatch.setattr(bayesian_optimization, '_HAS_NUMBA', False)
+    np.testing.assert_allclose(bo.expected_improvement(bo._X_cand), pool_ei, rtol=1e-5, atol=1e-10)
+    np.testing.assert_allclose(bo.expected_improvement(fresh), pool_ei, rtol=1e-5, atol=1e-10)
@@ -0,0 +1,65 @@
+# test_match_analyzer_settings.py
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from settings_matching import match_analyzer_settings, match_frequency_table_center_frequency  # noqa: E402
+
+PARAM_MAPPING = {
+    'Technology': 'Technology',
+    'Band': 'Band',
+    'Bandwidth': 'Bandwidth',
+    'Channel': 'Channel',
+}
+
+
+def _settings_df(with_channel):
+    data = {
+        'Technology': ['NR', 'NR'],
+        'Band': ['n257;n258', 'n260'],
+        'Bandwidth': [100, 100],
+    }
+    # 앞 5개 컬럼은 매칭용, 6번째 컬럼부터 분석기 설정
+    if with_channel:
+        data['Channel'] = [None, None]
+    else:
+        data['Mode'] = ['SISO', 'SISO']
+    data['Test'] = ['Power', 'Power']
+    data['Span'] = [200e6, 400e6]
+    return pd.DataFrame(data)
+
+
+def test_missing_channel_column_is_not_compared():
+    # Channel 컬럼이 없는 시트도 나머지 키로 매칭되어야 함
+    test_params = {'Technology': 'NR', 'Band': 'n260', 'Bandwidth': 100, 'Channel': 2079167}
+    result = match_analyzer_settings(test_params, _settings_df(with_channel=False), PARAM_MAPPING)
+    assert result == {'Span': 400e6}
+
+
+def test_empty_channel_cells_are_not_compared():
+    test_params = {'Technology': 'NR', 'Band': 'n258', 'Bandwidth': 100, 'Channel': 2079167}
+    result = match_analyzer_settings(test_params, _settings_df(with_channel=True), PARAM_MAPPING)
+    assert result == {'Span': 200e6}
+
+
+def test_no_match_returns_none():
+    test_params = {'Technology': 'LTE', 'Band': 'n260', 'Bandwidth': 100, 'Channel': 1}
+    assert match_analyzer_settings(test_params, _settings_df(with_channel=False), PARAM_MAPPING) is None
+
+
+def test_frequency_table_matches_any_listed_band():
+    table = pd.DataFrame({
+        'Band': ['n257;n258', 'n260'],
+        'Technology': ['NR', 'NR'],
+        'Bandwidth': [100, 100],
+        'Channel': [2079167, 2254165],
+        'Center Frequency': [27.5e9, 38.5e9],
+    })
+    params = {'Band': 'n258', 'Technology': 'NR', 'Bandwidth': 100, 'Channel': 2079167}
+    assert match_frequency_table_center_frequency(params, table) == 27.5e9
+    params['Band'] = 'n261'
+    assert match_frequency_table_center_frequency(params, table) is None
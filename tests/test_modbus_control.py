@@ -0,0 +1,155 @@
+# test_modbus_control.py
+import logging
+import os
+import struct
+import sys
+import time
+
+import pytest
+
+minimalmodbus = pytest.importorskip("minimalmodbus")
+pytest.importorskip("serial")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import modbus_control_final as mc  # noqa: E402
+
+# 하드웨어 없이 생성: 포트 열기에 실패하면 instrument가 None인 컨트롤러가 만들어짐
+logging.disable(logging.CRITICAL)
+
+
+def _positioner(positioner_type=mc.PositionerType.TURNTABLE_ROLL):
+    return mc.create_positioner(positioner_type, '/dev/nonexistent-port')
+
+
+def test_is_moving_without_idle_since_compares_with_previous_sample():
+    positioner = _positioner()
+    assert not positioner.is_moving(10.0, 90.0)  # 첫 샘플은 비교 대상 없음
+    assert positioner.is_moving(12.0, 90.0)
+    assert not positioner.is_moving(12.0, 90.0)
+    assert not positioner.is_moving(90.0, 90.0)
+
+
+def test_is_moving_with_idle_since_is_time_based():
+    positioner = _positioner()
+    assert positioner.is_moving(10.0, 90.0, idle_since=time.time())
+    assert not positioner.is_moving(10.0, 90.0, idle_since=time.time() - mc.RESTART_IDLE_S)
+    assert not positioner.is_moving(90.0, 90.0, idle_since=time.time())
+
+
+def test_check_position_continuously_reports_actual_restart(monkeypatch):
+    positioner = _positioner()
+    start = time.time()
+    pulses = []
+    # __slots__ 클래스라 인스턴스 대신 클래스 메서드를 교체
+    monkeypatch.setattr(mc.RollPositioner, '_execute_modbus_command', lambda self, func: pulses.append(func) or True)
+
+    # 아직 RESTART_IDLE_S가 지나지 않음: 재전송 없음
+    assert positioner.check_position_continuously(90.0, start, 120, 10.0, time.time()) == (False, False)
+    # 정지 상태: 재전송했음을 반환
+    idle = time.time() - mc.RESTART_IDLE_S
+    assert positioner.check_position_continuously(90.0, start, 120, 10.0, idle) == (False, True)
+    assert len(pulses) == 1
+
+    # 통신 실패로 재전송하지 못하면 restarted=False
+    monkeypatch.setattr(mc.RollPositioner, '_execute_modbus_command', lambda self, func: None)
+    assert positioner.check_position_continuously(90.0, start, 120, 10.0, idle) == (False, False)
+
+
+def test_emergency_stop_aborts_move_loop_without_restarting(monkeypatch):
+    system = mc.MeasurementSystem({'ANT_ROLL': '/dev/nonexistent-a', 'EUT_ROLL': '/dev/nonexistent-e',
+                                   'TT_ROLL': '/dev/nonexistent-t'})
+    pulses = []
+    # 위치가 변하지 않는 축: 중단 신호가 없으면 RESTART_IDLE_S 뒤 START를 다시 보냄
+    monkeypatch.setattr(mc.RollPositioner, 'read_position', lambda self, use_cache=True: 10.0)
+    monkeypatch.setattr(mc.RollPositioner, 'write_target_and_start', lambda self, counts: True)
+    monkeypatch.setattr(mc.RollPositioner, '_execute_modbus_command',
+                        lambda self, func, *args: pulses.append(func) or True)
+
+    future = system._executor.submit(system.turntable_roll.move_to_position, 90.0)
+    time.sleep(0.1)
+    system.emergency_stop_all()
+    assert future.result(timeout=mc.RESTART_IDLE_S) is False
+
+    pulses.clear()
+    time.sleep(mc.RESTART_IDLE_S + 0.1)
+    assert pulses == []
+    # 비상 정지가 걸려 있는 동안 새 이동은 명령하지 않음
+    assert system.turntable_roll.move_to_position(90.0) is False
+    system.cleanup()
+
+
+def test_emergency_stop_after_cleanup_runs_synchronously():
+    system = mc.MeasurementSystem({'ANT_ROLL': '/dev/nonexistent-a', 'EUT_ROLL': '/dev/nonexistent-e',
+                                   'TT_ROLL': '/dev/nonexistent-t'})
+    system.cleanup()
+    system.emergency_stop_all()  # 작업자 종료 후에도 RuntimeError 없이 실행
+    assert system.turntable_roll._abort.is_set()
+
+
+def test_cached_state_reports_speed_read_from_device():
+    positioner = _positioner()
+    base = positioner._loc_start
+    registers = [0] * positioner._state_count
+    registers[0], registers[1] = 90 * 373, 0
+    registers[positioner._speed_start - base] = 2500
+
+    positioner._last_speed = 3000  # 마지막으로 명령한 속도와 장비 값이 다른 경우
+    positioner._state_from_registers(registers, base)
+    assert positioner._cached_state() == {'position': 90.0, 'speed': 2500}
+
+    positioner._pos_cache_ttl = 0.0  # TTL이 지나면 캐시를 쓰지 않음
+    assert positioner._cached_state() is None
+
+
+def _crc16_bitwise(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def test_crc16_table_matches_bitwise_and_minimalmodbus():
+    assert len(mc._CRC16_TABLE) == 256
+    frame = bytes.fromhex('01030000000a')
+    assert mc._crc16_modbus(frame) == 0xCDC5
+    for data in (b'', frame, bytes(range(256)), b'\xe9\x03\x00\x04\x00\x02'):
+        assert mc._crc16_modbus(data) == _crc16_bitwise(data)
+        assert struct.pack('<H', mc._crc16_modbus(data)) == minimalmodbus._calculate_crc(data)
+
+
+def test_read_request_frame_has_valid_crc():
+    frame = mc._build_read_request(233, 3, 4, 2)
+    assert frame[:6] == bytes([233, 3, 0, 4, 0, 2])
+    assert frame[6:] == minimalmodbus._calculate_crc(frame[:6])
+
+
+@pytest.mark.parametrize('positioner_type, current, target, expected', [
+    (mc.PositionerType.TURNTABLE_ROLL, 350.0, 10.0, 10.0),     # 370은 범위 밖 -> 등가 위치
+    (mc.PositionerType.TURNTABLE_ROLL, 10.0, 350.0, 350.0),    # -10은 범위 밖 -> 등가 위치
+    (mc.PositionerType.TURNTABLE_ROLL, 0.0, 180.0, 180.0),     # 정확히 180도 차이
+    (mc.PositionerType.EUT_ROLL, 350.0, 10.0, 10.0),           # 370은 +360 한계 초과
+    (mc.PositionerType.EUT_ROLL, 10.0, 350.0, -10.0),          # 음수 범위 허용 축은 짧은 쪽으로
+    (mc.PositionerType.EUT_ROLL, 0.0, 180.0, -180.0),          # ±180은 [-180, 180) 규칙으로 -180
+    (mc.PositionerType.EUT_ROLL, 300.0, -300.0, 60.0),         # 420은 범위 밖 -> -300과 같은 60도
+    (mc.PositionerType.ANTENNA_ROLL, 170.0, 10.0, 10.0),
+    (mc.PositionerType.ANTENNA_ROLL, 90.0, 90.0, 90.0),
+])
+def test_roll_shortest_path(positioner_type, current, target, expected):
+    assert _positioner(positioner_type).determine_shortest_path(current, target) == pytest.approx(expected)
+
+
+def test_height_shortest_path_is_target():
+    assert _positioner(mc.PositionerType.ANTENNA_HEIGHT).determine_shortest_path(1600.0, 1700.0) == 1700.0
+
+
+@pytest.mark.parametrize('counts', [0, 1, 0xFFFF, 0x10000, 0x12345678, 373 * 359])
+def test_state_registers_decode_low_word_first(counts):
+    positioner = _positioner()
+    # minimalmodbus BYTEORDER_LITTLE_SWAP으로 인코딩한 레지스터 열을 그대로 디코드
+    encoded = minimalmodbus._long_to_bytes(counts, False, 2, minimalmodbus.BYTEORDER_LITTLE_SWAP)
+    registers = list(struct.unpack('>HH', encoded)) + [0] * (positioner._state_count - 2)
+    positioner._state_from_registers(registers, positioner._loc_start)
+    assert positioner._pos_cache[1] == counts
+    assert minimalmodbus._bytes_to_long(encoded, False, 2, mc.LONG_BYTEORDER) == counts